@@ -3,6 +3,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from functools import cached_property
 
 import numpy as np
 import pandas as pd
@@ -36,7 +37,11 @@ DEFAULT_WEATHER_CONDITIONS = [
 
 @dataclass
 class AdaptiveGeneralCover(ABC):
-    """Collect common data."""
+    """Collect common data.
+
+    A cover is built for each coordinator update and its fields are not
+    reassigned afterwards, so geometry derived only from fields is cached.
+    """
 
     hass: HomeAssistant
     logger: ConfigContextAdapter
@@ -90,12 +95,12 @@ class AdaptiveGeneralCover(ABC):
                 solpos[frame].index[-1].to_pydatetime(),
             )
 
-    @property
+    @cached_property
     def _get_azimuth_edges(self) -> tuple[int, int]:
         """Calculate azimuth edges."""
         return self.fov_left + self.fov_right
 
-    @property
+    @cached_property
     def is_sun_in_blind_spot(self) -> bool:
         """Check if sun is in blind spot."""
         if (
@@ -112,26 +117,26 @@ class AdaptiveGeneralCover(ABC):
             return blindspot
         return False
 
-    @property
+    @cached_property
     def azi_min_abs(self) -> int:
         """Calculate min azimuth."""
         azi_min_abs = (self.win_azi - self.fov_left + 360) % 360
         return azi_min_abs
 
-    @property
+    @cached_property
     def azi_max_abs(self) -> int:
         """Calculate max azimuth."""
         azi_max_abs = (self.win_azi + self.fov_right + 360) % 360
         return azi_max_abs
 
-    @property
+    @cached_property
     def gamma(self) -> float:
         """Calculate Gamma."""
         # surface solar azimuth
         gamma = (self.win_azi - self.sol_azi + 180) % 360 - 180
         return gamma
 
-    @property
+    @cached_property
     def valid_elevation(self) -> bool:
         """Check if elevation is within range."""
         if self.min_elevation is None and self.max_elevation is None:
@@ -144,7 +149,7 @@ class AdaptiveGeneralCover(ABC):
         self.logger.debug("elevation within range? %s", within_range)
         return within_range
 
-    @property
+    @cached_property
     def valid(self) -> bool:
         """Determine if sun is in front of window."""
         # clip azi_min and azi_max to 90
@@ -771,7 +776,7 @@ class AdaptiveVerticalCover(AdaptiveGeneralCover):
     cover_bottom: float = 0.0  # height from floor to bottom of fully extended cover
     shaded_area_height: float = 0.0  # height of the area to protect from sun
 
-    @property
+    @cached_property
     def cover_height(self) -> float:
         """Total cover extension range."""
         return self.h_win - self.cover_bottom
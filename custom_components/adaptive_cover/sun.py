@@ -1,10 +1,112 @@
 """Fetch sun data."""
 
 from datetime import date, datetime, timedelta
+from functools import cached_property, lru_cache
 
+import numpy as np
 import pandas as pd
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.sun import get_astral_location
+from numpy import radians as rad
+
+
+@lru_cache(maxsize=8)
+def _build_times(day: date, timezone: str) -> pd.DatetimeIndex:
+    """Return the 5-minute grid for a day, shared by every SunData that day."""
+    return pd.date_range(
+        start=day, end=day + timedelta(days=1), freq="5min", tz=timezone, name="time"
+    )
+
+
+def _solar_position(
+    latitude: float, longitude: float, times: pd.DatetimeIndex
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return solar elevation and azimuth in degrees for every time.
+
+    Vectorized port of astral's NOAA model (astral.sun.zenith_and_azimuth,
+    including refraction), so results match Location.solar_elevation and
+    Location.solar_azimuth without a Python call per timestamp.
+    """
+    lat = rad(np.clip(latitude, -89.8, 89.8))
+    utc = times.tz_convert("UTC").tz_localize(None)
+    jc = (utc.to_julian_date().to_numpy() - 2451545.0) / 36525.0
+    minutes = (utc.hour * 60.0 + utc.minute + utc.second / 60.0).to_numpy()
+
+    # Sun's declination and equation of time
+    l0 = (280.46646 + jc * (36000.76983 + 0.0003032 * jc)) % 360.0
+    m = rad(357.52911 + jc * (35999.05029 - 0.0001537 * jc))
+    e = 0.016708634 - jc * (0.000042037 + 0.0000001267 * jc)
+    c = (
+        np.sin(m) * (1.914602 - jc * (0.004817 + 0.000014 * jc))
+        + np.sin(2 * m) * (0.019993 - 0.000101 * jc)
+        + np.sin(3 * m) * 0.000289
+    )
+    omega = rad(125.04 - 1934.136 * jc)
+    apparent_long = rad(l0 + c - 0.00569 - 0.00478 * np.sin(omega))
+    seconds = 21.448 - jc * (46.815 + jc * (0.00059 - jc * 0.001813))
+    obliquity = rad(23.0 + (26.0 + seconds / 60.0) / 60.0 + 0.00256 * np.cos(omega))
+    declination = np.arcsin(np.sin(obliquity) * np.sin(apparent_long))
+    y = np.tan(obliquity / 2.0) ** 2
+    l0 = rad(l0)
+    eq_time = 4.0 * np.degrees(
+        y * np.sin(2 * l0)
+        - 2.0 * e * np.sin(m)
+        + 4.0 * e * y * np.sin(m) * np.cos(2 * l0)
+        - 0.5 * y * y * np.sin(4 * l0)
+        - 1.25 * e * e * np.sin(2 * m)
+    )
+
+    true_solar_time = minutes + eq_time + 4.0 * longitude
+    true_solar_time = np.where(
+        true_solar_time > 1440,
+        true_solar_time - 1440 * np.ceil((true_solar_time - 1440) / 1440),
+        true_solar_time,
+    )
+    hour_angle = true_solar_time / 4.0 - 180.0
+    hour_angle = np.where(hour_angle < -180, hour_angle + 360.0, hour_angle)
+
+    csz = np.clip(
+        np.sin(lat) * np.sin(declination)
+        + np.cos(lat) * np.cos(declination) * np.cos(rad(hour_angle)),
+        -1.0,
+        1.0,
+    )
+    zenith = np.degrees(np.arccos(csz))
+
+    az_denom = np.cos(lat) * np.sin(rad(zenith))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        az_rad = np.clip(
+            (np.sin(lat) * np.cos(rad(zenith)) - np.sin(declination)) / az_denom,
+            -1.0,
+            1.0,
+        )
+    azimuth = 180.0 - np.degrees(np.arccos(az_rad))
+    azimuth = np.where(hour_angle > 0.0, -azimuth, azimuth)
+    azimuth = np.where(
+        np.abs(az_denom) > 0.001, azimuth, 180.0 if latitude > 0.0 else 0.0
+    )
+    azimuth = np.where(azimuth < 0.0, azimuth + 360.0, azimuth)
+
+    # Atmospheric refraction, in arc seconds
+    elevation = 90.0 - zenith
+    te = np.tan(rad(elevation))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        refraction = np.select(
+            [elevation >= 85.0, elevation > 5.0, elevation > -0.575],
+            [
+                0.0,
+                58.1 / te - 0.07 / te**3 + 0.000086 / te**5,
+                1735.0
+                + elevation
+                * (
+                    -518.2
+                    + elevation * (103.4 + elevation * (-12.79 + elevation * 0.711))
+                ),
+            ],
+            default=-20.774 / te,
+        )
+
+    return elevation + refraction / 3600.0, azimuth
 
 
 class SunData:
@@ -14,51 +116,52 @@ class SunData:
         self.hass = hass
         location, elevation = get_astral_location(self.hass)
         self.location = location  # astral.location.Location
+        # Observer elevation only shifts sunrise/sunset; astral 2.2 ignores it
+        # for solar azimuth and elevation, so _solar_position does not take it
         self.elevation = elevation
         self.timezone = timezone
+        # Read the clock once; SunData is rebuilt on every coordinator update
+        self.today = date.today()
+        self._sun_events: dict[tuple[str, date], datetime] = {}
 
-    @property
+    @cached_property
     def times(self) -> pd.DatetimeIndex:
         """Define time interval."""
-        start_date = date.today()
-        end_date = start_date + timedelta(days=1)
+        return _build_times(self.today, self.timezone)
 
-        times = pd.date_range(
-            start=start_date, end=end_date, freq="5min", tz=self.timezone, name="time"
+    @cached_property
+    def _positions(self) -> tuple[np.ndarray, np.ndarray]:
+        """Compute solar elevation and azimuth for every time, once."""
+        return _solar_position(
+            self.location.latitude, self.location.longitude, self.times
         )
-        return times
 
     @property
     def solar_azimuth(self) -> list:
         """Create list with solar azimuth data per 5 minutes."""
-        index = 0
-        azi_list = []
-        for _i in self.times:
-            azi_list.append(
-                self.location.solar_azimuth(self.times[index], self.elevation)
-            )
-            index += 1
-        return azi_list
+        _, azimuth = self._positions
+        return azimuth.tolist()
 
     @property
     def solar_elevation(self) -> list:
         """Create list with solar elevation data per 5 minutes."""
-        index = 0
-        ele_list = []
-        for _i in self.times:
-            ele_list.append(
-                self.location.solar_elevation(self.times[index], self.elevation)
-            )
-            index += 1
-        return ele_list
-
-    def sunset(self) -> datetime:
-        """Fetch sunset time."""
-        return self.location.sunset(date.today(), local=False)
-
-    def sunrise(self) -> datetime:
-        """Fetch sunrise time."""
-        return self.location.sunrise(date.today(), local=False)
+        elevation, _ = self._positions
+        return elevation.tolist()
+
+    def _sun_event(self, event: str, day: date) -> datetime:
+        """Fetch sunrise or sunset for a day, computed once per day."""
+        key = (event, day)
+        if key not in self._sun_events:
+            self._sun_events[key] = getattr(self.location, event)(day, local=False)
+        return self._sun_events[key]
+
+    def sunset(self, today: date | None = None) -> datetime:
+        """Fetch sunset time, for today unless another date is given."""
+        return self._sun_event("sunset", today or self.today)
+
+    def sunrise(self, today: date | None = None) -> datetime:
+        """Fetch sunrise time, for today unless another date is given."""
+        return self._sun_event("sunrise", today or self.today)
 
     # def df_today(self)-> pd.DataFrame:
     #     """Create dataframe with azimuth and elevation data"""
@@ -43,9 +43,9 @@ if TYPE_CHECKING:
     pass
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_logger() -> ConfigContextAdapter:
-    """Create a mock logger for testing."""
+    """Create a logger for testing, shared by the whole session."""
     logger = ConfigContextAdapter(logging.getLogger("test"))
     logger.set_config_name("test_cover")
     return logger
@@ -60,77 +60,6 @@ def mock_sun_data() -> MagicMock:
     return sun_data
 
 
-@pytest.fixture
-def vertical_cover_params() -> dict[str, Any]:
-    """Return base parameters for AdaptiveVerticalCover."""
-    return {
-        "sol_azi": 180.0,  # Sun from south
-        "sol_elev": 45.0,  # 45 degree elevation
-        "sunset_pos": 0,
-        "sunset_off": 30,
-        "sunrise_off": 30,
-        "timezone": "Europe/Amsterdam",
-        "fov_left": 90,
-        "fov_right": 90,
-        "win_azi": 180,  # South-facing window
-        "h_def": 60,  # Default position
-        "max_pos": 100,
-        "min_pos": 0,
-        "max_pos_bool": False,
-        "min_pos_bool": False,
-        "blind_spot_left": None,
-        "blind_spot_right": None,
-        "blind_spot_elevation": None,
-        "blind_spot_on": False,
-        "min_elevation": None,
-        "max_elevation": None,
-        "distance": 0.5,
-        "h_win": 2.1,
-        "cover_bottom": 0.0,
-        "shaded_area_height": 0.0,
-    }
-
-
-@pytest.fixture
-def horizontal_cover_params(vertical_cover_params: dict[str, Any]) -> dict[str, Any]:
-    """Return base parameters for AdaptiveHorizontalCover."""
-    return {
-        **vertical_cover_params,
-        "awn_length": 2.1,
-        "awn_angle": 0.0,
-    }
-
-
-@pytest.fixture
-def tilt_cover_params() -> dict[str, Any]:
-    """Return base parameters for AdaptiveTiltCover."""
-    return {
-        "sol_azi": 180.0,
-        "sol_elev": 45.0,
-        "sunset_pos": 0,
-        "sunset_off": 30,
-        "sunrise_off": 30,
-        "timezone": "Europe/Amsterdam",
-        "fov_left": 90,
-        "fov_right": 90,
-        "win_azi": 180,
-        "h_def": 50,
-        "max_pos": 100,
-        "min_pos": 0,
-        "max_pos_bool": False,
-        "min_pos_bool": False,
-        "blind_spot_left": None,
-        "blind_spot_right": None,
-        "blind_spot_elevation": None,
-        "blind_spot_on": False,
-        "min_elevation": None,
-        "max_elevation": None,
-        "slat_distance": 0.025,
-        "depth": 0.02,
-        "mode": "mode1",
-    }
-
-
 @pytest.fixture
 def mock_config_entry_data() -> dict[str, Any]:
     """Mock config entry data for a vertical cover."""
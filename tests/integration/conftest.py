@@ -0,0 +1,33 @@
+"""Shared fixtures for Adaptive Cover integration tests."""
+
+from __future__ import annotations
+
+from types import MappingProxyType, SimpleNamespace
+
+import pytest
+
+from custom_components.adaptive_cover.const import CONF_ENTRY_TYPE, EntryType
+
+
+@pytest.fixture(scope="module")
+def mock_cover_config_entry() -> SimpleNamespace:
+    """Create a read-only ConfigEntry stand-in for a cover.
+
+    Module-scoped, so tests must not mutate it; override locally when a test
+    needs different data or options.
+    """
+    return SimpleNamespace(
+        entry_id="test_cover_entry",
+        data=MappingProxyType({"name": "Test Cover", CONF_ENTRY_TYPE: EntryType.COVER}),
+        options=MappingProxyType({}),
+    )
+
+
+@pytest.fixture(scope="module")
+def mock_room_config_entry() -> SimpleNamespace:
+    """Create a read-only ConfigEntry stand-in for a room."""
+    return SimpleNamespace(
+        entry_id="test_room_entry",
+        data=MappingProxyType({"name": "Test Room", CONF_ENTRY_TYPE: EntryType.ROOM}),
+        options=MappingProxyType({}),
+    )
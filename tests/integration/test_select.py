@@ -17,6 +17,7 @@ from custom_components.adaptive_cover.const import (
     DOMAIN,
     EntryType,
 )
+from custom_components.adaptive_cover.room_coordinator import RoomCoordinator
 from custom_components.adaptive_cover.select import ControlModeSelect
 
 if TYPE_CHECKING:
@@ -26,6 +27,11 @@ if TYPE_CHECKING:
 class TestControlModeSelect:
     """Tests for ControlModeSelect."""
 
+    @pytest.fixture(autouse=True)
+    def _silence_ha_write(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Stub async_write_ha_state since we're not in hass context."""
+        monkeypatch.setattr(ControlModeSelect, "async_write_ha_state", MagicMock())
+
     @pytest.fixture
     def mock_cover_coordinator(self) -> MagicMock:
         """Create mock AdaptiveDataUpdateCoordinator."""
@@ -40,8 +46,7 @@ class TestControlModeSelect:
     @pytest.fixture
     def mock_room_coordinator(self) -> MagicMock:
         """Create mock RoomCoordinator."""
-        from custom_components.adaptive_cover.room_coordinator import RoomCoordinator
-
+        # spec is required: async_select_option dispatches on isinstance()
         coordinator = MagicMock(spec=RoomCoordinator)
         coordinator.logger = MagicMock()
         coordinator.control_mode = CONTROL_MODE_AUTO
@@ -155,9 +160,6 @@ class TestControlModeSelect:
             coordinator=mock_cover_coordinator,
         )
 
-        # Mock the async_write_ha_state method since we're not in hass context
-        select.async_write_ha_state = MagicMock()
-
         await select.async_select_option(CONTROL_MODE_DISABLED)
 
         assert select._attr_current_option == CONTROL_MODE_DISABLED
@@ -176,9 +178,6 @@ class TestControlModeSelect:
             coordinator=mock_room_coordinator,
         )
 
-        # Mock the async_write_ha_state method
-        select.async_write_ha_state = MagicMock()
-
         await select.async_select_option(CONTROL_MODE_FORCE)
 
         assert select._attr_current_option == CONTROL_MODE_FORCE
@@ -196,9 +195,6 @@ class TestControlModeSelect:
             coordinator=mock_cover_coordinator,
         )
 
-        # Mock async_write_ha_state
-        select.async_write_ha_state = MagicMock()
-
         select.set_control_mode(CONTROL_MODE_DISABLED)
 
         assert select._attr_current_option == CONTROL_MODE_DISABLED
@@ -214,9 +210,6 @@ class TestControlModeSelect:
             coordinator=mock_cover_coordinator,
         )
 
-        # Mock async_write_ha_state
-        select.async_write_ha_state = MagicMock()
-
         select.set_control_mode("invalid_mode")
 
         # Should remain at AUTO since invalid mode is ignored
@@ -278,9 +271,8 @@ class TestSelectAsyncSetupEntry:
     @pytest.fixture
     def mock_room_coordinator(self) -> MagicMock:
         """Create mock RoomCoordinator."""
-        from custom_components.adaptive_cover.room_coordinator import RoomCoordinator
-
-        coordinator = MagicMock(spec=RoomCoordinator)
+        # No spec needed: async_setup_entry never isinstance-checks the coordinator
+        coordinator = MagicMock()
         coordinator.logger = MagicMock()
         coordinator.control_mode = CONTROL_MODE_AUTO
         coordinator.async_refresh = AsyncMock()
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field, replace
 from datetime import datetime
-from typing import TYPE_CHECKING
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
@@ -19,7 +20,7 @@ from custom_components.adaptive_cover.const import (
     EntryType,
 )
 from custom_components.adaptive_cover.coordinator import AdaptiveCoverData
-from custom_components.adaptive_cover.room_coordinator import RoomData
+from custom_components.adaptive_cover.room_coordinator import RoomCoordinator, RoomData
 from custom_components.adaptive_cover.sensor import (
     AdaptiveCoverCloudSensorEntity,
     AdaptiveCoverControlSensorEntity,
@@ -29,345 +30,330 @@ from custom_components.adaptive_cover.sensor import (
     async_setup_entry,
 )
 
-if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
+# Read-only options shared by the config entry fixtures
+_EMPTY_OPTIONS = MappingProxyType({})
+_TEMP_OPTIONS = MappingProxyType({CONF_TEMP_ENTITY: "sensor.inside_temp"})
+_CLOUD_TEMP_OPTIONS = MappingProxyType(
+    {CONF_CLOUD_ENTITY: "sensor.cloud", CONF_TEMP_ENTITY: "sensor.inside_temp"}
+)
+
+# Coordinator payloads shared across tests; swap in a dataclasses.replace()
+# copy rather than mutating these.
+_FAKE_NOW = datetime(2024, 1, 1, 12, 0, 0)
+_DEFAULT_STATES = {"state": 50, "start": _FAKE_NOW, "end": _FAKE_NOW}
+_DEFAULT_DATA = AdaptiveCoverData(
+    climate_mode_toggle=True,
+    states=_DEFAULT_STATES,
+    attributes={"azimuth": 180, "fov": [90, 270]},
+)
+_TIME_DATA = AdaptiveCoverData(
+    climate_mode_toggle=True,
+    states={
+        "state": 50,
+        "start": datetime(2024, 6, 21, 8, 0, 0),
+        "end": datetime(2024, 6, 21, 20, 0, 0),
+    },
+    attributes={},
+)
+_COMFORT_DATA = AdaptiveCoverData(
+    climate_mode_toggle=True,
+    states={"comfort_status": "comfortable"},
+    attributes={},
+)
+_CLOUD_DATA = AdaptiveCoverData(
+    climate_mode_toggle=True,
+    states={"cloud_coverage": 25.0},
+    attributes={},
+)
+_SETUP_DATA = AdaptiveCoverData(
+    climate_mode_toggle=True,
+    states={
+        **_TIME_DATA.states,
+        "comfort_status": "comfortable",
+        "cloud_coverage": 25.0,
+    },
+    attributes={"azimuth": 180, "fov": [90, 270]},
+)
+
+_ROOM_DATA_WITH_CLOUD = RoomData(
+    control_mode="auto",
+    lux_toggle=None,
+    irradiance_toggle=None,
+    cloud_toggle=None,
+    weather_toggle=None,
+    is_presence=True,
+    has_direct_sun=True,
+    last_known={"cloud": 30.0},
+)
+_ROOM_DATA_EMPTY = replace(_ROOM_DATA_WITH_CLOUD, last_known={})
+
+
+@dataclass(slots=True)
+class FakeCoordinator:
+    """Plain stand-in for the coordinator attributes the sensors read.
+
+    Use MagicMock(spec=RoomCoordinator) instead where code isinstance-checks it.
+    """
+
+    data: object = None
+    control_mode: str = CONTROL_MODE_AUTO
+    comfort_status: str | None = None
+    last_update_success: bool = True
+    _child_coordinators: list = field(default_factory=list)
+    config_entry: object = None
+
+
+async def _collect_entities(hass, entry) -> list:
+    """Run async_setup_entry for a registered entry and return its entities."""
+    added: list = []
+    await async_setup_entry(hass, entry, added.extend)
+    return added
 
 
 class TestAdaptiveCoverSensorEntity:
     """Tests for AdaptiveCoverSensorEntity (position sensor)."""
 
-    @pytest.fixture
-    def mock_cover_coordinator(self) -> MagicMock:
+    @staticmethod
+    def _make_cover_coordinator() -> FakeCoordinator:
         """Create mock AdaptiveDataUpdateCoordinator."""
-        coordinator = MagicMock()
-        coordinator.data = AdaptiveCoverData(
-            climate_mode_toggle=True,
-            states={"state": 50, "start": datetime.now(), "end": datetime.now()},
-            attributes={"azimuth": 180, "fov": [90, 270]},
-        )
-        coordinator.control_mode = CONTROL_MODE_AUTO
-        return coordinator
+        return FakeCoordinator(data=_DEFAULT_DATA, control_mode=CONTROL_MODE_AUTO)
 
-    @pytest.fixture
-    def mock_cover_config_entry(self) -> MagicMock:
-        """Create mock ConfigEntry for cover."""
-        entry = MagicMock()
-        entry.entry_id = "test_cover_entry"
-        entry.data = {"name": "Test Cover", CONF_ENTRY_TYPE: EntryType.COVER}
-        entry.options = {}
-        return entry
+    @pytest.fixture(scope="class")
+    def mock_cover_coordinator_readonly(self) -> FakeCoordinator:
+        """Create coordinator shared by tests that never mutate it."""
+        return self._make_cover_coordinator()
 
     @pytest.fixture
-    def mock_hass(self, hass: HomeAssistant) -> HomeAssistant:
-        """Return Home Assistant instance."""
-        return hass
-
-    def test_init_standalone(
-        self,
-        mock_hass: HomeAssistant,
-        mock_cover_config_entry: MagicMock,
-        mock_cover_coordinator: MagicMock,
-    ) -> None:
-        """Test initialization for standalone cover."""
-        sensor = AdaptiveCoverSensorEntity(
+    def mock_cover_coordinator_mutable(self) -> FakeCoordinator:
+        """Create fresh coordinator for tests that change data or control mode."""
+        return self._make_cover_coordinator()
+
+    @pytest.fixture(scope="class")
+    def standalone_sensor(
+        self,
+        mock_cover_config_entry: SimpleNamespace,
+        mock_cover_coordinator_readonly: FakeCoordinator,
+    ) -> AdaptiveCoverSensorEntity:
+        """Create standalone sensor shared by read-only property tests."""
+        # Property reads never touch hass, so pass None (the Entity default
+        # before being added) instead of depending on the function-scoped hass.
+        return AdaptiveCoverSensorEntity(
             unique_id=mock_cover_config_entry.entry_id,
-            hass=mock_hass,
+            hass=None,
             config_entry=mock_cover_config_entry,
             name="Test Cover",
-            coordinator=mock_cover_coordinator,
+            coordinator=mock_cover_coordinator_readonly,
         )
 
-        assert sensor._name == "Test Cover"
-        assert sensor._attr_unique_id == "test_cover_entry_Cover Position"
-        assert sensor._attr_name == "Cover Position"
-        assert sensor._room_id is None
-
-    def test_init_cover_in_room(
+    @pytest.fixture(scope="class")
+    def room_sensor(
         self,
-        mock_hass: HomeAssistant,
-        mock_cover_config_entry: MagicMock,
-        mock_cover_coordinator: MagicMock,
-    ) -> None:
-        """Test initialization for cover in room."""
-        sensor = AdaptiveCoverSensorEntity(
+        mock_cover_config_entry: SimpleNamespace,
+        mock_cover_coordinator_readonly: FakeCoordinator,
+    ) -> AdaptiveCoverSensorEntity:
+        """Create in-room sensor shared by read-only property tests."""
+        return AdaptiveCoverSensorEntity(
             unique_id=mock_cover_config_entry.entry_id,
-            hass=mock_hass,
+            hass=None,
             config_entry=mock_cover_config_entry,
             name="Test Cover",
-            coordinator=mock_cover_coordinator,
+            coordinator=mock_cover_coordinator_readonly,
             room_id="room_123",
         )
 
-        assert sensor._room_id == "room_123"
-        assert sensor._attr_name == "Test Cover Cover Position"
-        assert sensor._attr_has_entity_name is False
-
-    def test_native_value(
+    @pytest.mark.parametrize(
+        ("room_id", "expected_name", "expected_has_entity_name"),
+        [
+            (None, "Cover Position", True),
+            ("room_123", "Test Cover Cover Position", False),
+        ],
+        ids=["standalone", "cover_in_room"],
+    )
+    def test_init(
         self,
-        mock_hass: HomeAssistant,
-        mock_cover_config_entry: MagicMock,
-        mock_cover_coordinator: MagicMock,
+        hass,
+        mock_cover_config_entry: SimpleNamespace,
+        mock_cover_coordinator_readonly: FakeCoordinator,
+        room_id: str | None,
+        expected_name: str,
+        expected_has_entity_name: bool,
     ) -> None:
-        """Test native_value returns position from states."""
+        """Test initialization for standalone cover and cover in room."""
         sensor = AdaptiveCoverSensorEntity(
             unique_id=mock_cover_config_entry.entry_id,
-            hass=mock_hass,
+            hass=hass,
             config_entry=mock_cover_config_entry,
             name="Test Cover",
-            coordinator=mock_cover_coordinator,
+            coordinator=mock_cover_coordinator_readonly,
+            room_id=room_id,
         )
 
-        assert sensor.native_value == 50
+        assert sensor._name == "Test Cover"
+        assert sensor._attr_unique_id == "test_cover_entry_Cover Position"
+        assert sensor._attr_name == expected_name
+        assert sensor._room_id == room_id
+        assert sensor._attr_has_entity_name is expected_has_entity_name
 
-    def test_native_value_no_data(
+    def test_native_value(self, standalone_sensor: AdaptiveCoverSensorEntity) -> None:
+        """Test native_value returns position from states."""
+        assert standalone_sensor.native_value == 50
+
+    @pytest.mark.parametrize(
+        ("attr", "expected"),
+        [
+            ("native_value", None),
+            ("available", False),
+            ("extra_state_attributes", None),
+        ],
+    )
+    def test_no_data_returns_none(
         self,
-        mock_hass: HomeAssistant,
-        mock_cover_config_entry: MagicMock,
-        mock_cover_coordinator: MagicMock,
+        hass,
+        mock_cover_config_entry: SimpleNamespace,
+        mock_cover_coordinator_mutable: FakeCoordinator,
+        attr: str,
+        expected: bool | None,
     ) -> None:
-        """Test native_value returns None when no data."""
-        mock_cover_coordinator.data = None
+        """Test properties fall back to None/False when there is no data."""
+        mock_cover_coordinator_mutable.data = None
 
         sensor = AdaptiveCoverSensorEntity(
             unique_id=mock_cover_config_entry.entry_id,
-            hass=mock_hass,
+            hass=hass,
             config_entry=mock_cover_config_entry,
             name="Test Cover",
-            coordinator=mock_cover_coordinator,
+            coordinator=mock_cover_coordinator_mutable,
         )
 
-        assert sensor.native_value is None
+        assert getattr(sensor, attr) == expected
 
     def test_available_disabled_mode(
         self,
-        mock_hass: HomeAssistant,
-        mock_cover_config_entry: MagicMock,
-        mock_cover_coordinator: MagicMock,
+        hass,
+        mock_cover_config_entry: SimpleNamespace,
+        mock_cover_coordinator_mutable: FakeCoordinator,
     ) -> None:
         """Test available is False when control mode is disabled."""
-        mock_cover_coordinator.control_mode = CONTROL_MODE_DISABLED
+        mock_cover_coordinator_mutable.control_mode = CONTROL_MODE_DISABLED
 
         sensor = AdaptiveCoverSensorEntity(
             unique_id=mock_cover_config_entry.entry_id,
-            hass=mock_hass,
+            hass=hass,
             config_entry=mock_cover_config_entry,
             name="Test Cover",
-            coordinator=mock_cover_coordinator,
-        )
-
-        assert sensor.available is False
-
-    def test_available_no_data(
-        self,
-        mock_hass: HomeAssistant,
-        mock_cover_config_entry: MagicMock,
-        mock_cover_coordinator: MagicMock,
-    ) -> None:
-        """Test available is False when data is None."""
-        mock_cover_coordinator.data = None
-
-        sensor = AdaptiveCoverSensorEntity(
-            unique_id=mock_cover_config_entry.entry_id,
-            hass=mock_hass,
-            config_entry=mock_cover_config_entry,
-            name="Test Cover",
-            coordinator=mock_cover_coordinator,
+            coordinator=mock_cover_coordinator_mutable,
         )
 
         assert sensor.available is False
 
     def test_available_no_state(
         self,
-        mock_hass: HomeAssistant,
-        mock_cover_config_entry: MagicMock,
-        mock_cover_coordinator: MagicMock,
+        hass,
+        mock_cover_config_entry: SimpleNamespace,
+        mock_cover_coordinator_mutable: FakeCoordinator,
     ) -> None:
         """Test available is False when state is None."""
-        mock_cover_coordinator.data = AdaptiveCoverData(
-            climate_mode_toggle=True,
-            states={"state": None},
-            attributes={},
+        mock_cover_coordinator_mutable.data = replace(
+            _DEFAULT_DATA, states={"state": None}, attributes={}
         )
 
         sensor = AdaptiveCoverSensorEntity(
             unique_id=mock_cover_config_entry.entry_id,
-            hass=mock_hass,
+            hass=hass,
             config_entry=mock_cover_config_entry,
             name="Test Cover",
-            coordinator=mock_cover_coordinator,
+            coordinator=mock_cover_coordinator_mutable,
         )
 
         assert sensor.available is False
 
-    def test_device_info(
-        self,
-        mock_hass: HomeAssistant,
-        mock_cover_config_entry: MagicMock,
-        mock_cover_coordinator: MagicMock,
-    ) -> None:
+    def test_device_info(self, standalone_sensor: AdaptiveCoverSensorEntity) -> None:
         """Test device_info returns correct identifiers."""
-        sensor = AdaptiveCoverSensorEntity(
-            unique_id=mock_cover_config_entry.entry_id,
-            hass=mock_hass,
-            config_entry=mock_cover_config_entry,
-            name="Test Cover",
-            coordinator=mock_cover_coordinator,
-        )
-
-        device_info = sensor.device_info
-        identifiers = list(device_info["identifiers"])[0]
+        device_info = standalone_sensor.device_info
+        identifiers = next(iter(device_info["identifiers"]))
         assert identifiers[0] == DOMAIN
         assert identifiers[1] == "test_cover_entry"
         assert device_info["name"] == "Test Cover"
 
     def test_device_info_with_room(
-        self,
-        mock_hass: HomeAssistant,
-        mock_cover_config_entry: MagicMock,
-        mock_cover_coordinator: MagicMock,
+        self, room_sensor: AdaptiveCoverSensorEntity
     ) -> None:
         """Test device_info includes via_device when in room."""
-        sensor = AdaptiveCoverSensorEntity(
-            unique_id=mock_cover_config_entry.entry_id,
-            hass=mock_hass,
-            config_entry=mock_cover_config_entry,
-            name="Test Cover",
-            coordinator=mock_cover_coordinator,
-            room_id="room_123",
-        )
-
-        device_info = sensor.device_info
+        device_info = room_sensor.device_info
         assert "via_device" in device_info
         assert device_info["via_device"] == (DOMAIN, "room_room_123")
 
     def test_extra_state_attributes(
-        self,
-        mock_hass: HomeAssistant,
-        mock_cover_config_entry: MagicMock,
-        mock_cover_coordinator: MagicMock,
+        self, standalone_sensor: AdaptiveCoverSensorEntity
     ) -> None:
         """Test extra_state_attributes returns coordinator attributes."""
-        sensor = AdaptiveCoverSensorEntity(
-            unique_id=mock_cover_config_entry.entry_id,
-            hass=mock_hass,
-            config_entry=mock_cover_config_entry,
-            name="Test Cover",
-            coordinator=mock_cover_coordinator,
-        )
-
-        attrs = sensor.extra_state_attributes
+        attrs = standalone_sensor.extra_state_attributes
         assert attrs is not None
         assert attrs["azimuth"] == 180
         assert attrs["fov"] == [90, 270]
 
-    def test_extra_state_attributes_no_data(
-        self,
-        mock_hass: HomeAssistant,
-        mock_cover_config_entry: MagicMock,
-        mock_cover_coordinator: MagicMock,
-    ) -> None:
-        """Test extra_state_attributes returns None when no data."""
-        mock_cover_coordinator.data = None
-
-        sensor = AdaptiveCoverSensorEntity(
-            unique_id=mock_cover_config_entry.entry_id,
-            hass=mock_hass,
-            config_entry=mock_cover_config_entry,
-            name="Test Cover",
-            coordinator=mock_cover_coordinator,
-        )
-
-        assert sensor.extra_state_attributes is None
-
 
 class TestAdaptiveCoverTimeSensorEntity:
     """Tests for AdaptiveCoverTimeSensorEntity (start/end sun)."""
 
     @pytest.fixture
-    def mock_cover_coordinator(self) -> MagicMock:
+    def mock_cover_coordinator(self) -> FakeCoordinator:
         """Create mock AdaptiveDataUpdateCoordinator."""
-        coordinator = MagicMock()
-        coordinator.data = AdaptiveCoverData(
-            climate_mode_toggle=True,
-            states={
-                "state": 50,
-                "start": datetime(2024, 6, 21, 8, 0, 0),
-                "end": datetime(2024, 6, 21, 20, 0, 0),
-            },
-            attributes={},
-        )
-        return coordinator
-
-    @pytest.fixture
-    def mock_cover_config_entry(self) -> MagicMock:
-        """Create mock ConfigEntry for cover."""
-        entry = MagicMock()
-        entry.entry_id = "test_cover_entry"
-        entry.data = {"name": "Test Cover"}
-        entry.options = {}
-        return entry
-
-    @pytest.fixture
-    def mock_hass(self, hass: HomeAssistant) -> HomeAssistant:
-        """Return Home Assistant instance."""
-        return hass
-
-    def test_native_value_start(
-        self,
-        mock_hass: HomeAssistant,
-        mock_cover_config_entry: MagicMock,
-        mock_cover_coordinator: MagicMock,
-    ) -> None:
-        """Test native_value returns start time."""
-        sensor = AdaptiveCoverTimeSensorEntity(
-            unique_id=mock_cover_config_entry.entry_id,
-            hass=mock_hass,
-            config_entry=mock_cover_config_entry,
-            name="Test Cover",
-            sensor_name="Start Sun",
-            key="start",
-            icon="mdi:sun-clock-outline",
-            coordinator=mock_cover_coordinator,
-        )
-
-        assert sensor.native_value == datetime(2024, 6, 21, 8, 0, 0)
-
-    def test_native_value_end(
+        return FakeCoordinator(data=_TIME_DATA)
+
+    @pytest.mark.parametrize(
+        ("key", "sensor_name", "icon", "expected"),
+        [
+            ("start", "Start Sun", "mdi:sun-clock-outline", datetime(2024, 6, 21, 8)),
+            ("end", "End Sun", "mdi:sun-clock", datetime(2024, 6, 21, 20)),
+        ],
+    )
+    def test_native_value(
         self,
-        mock_hass: HomeAssistant,
-        mock_cover_config_entry: MagicMock,
-        mock_cover_coordinator: MagicMock,
-    ) -> None:
-        """Test native_value returns end time."""
+        hass,
+        mock_cover_config_entry: SimpleNamespace,
+        mock_cover_coordinator: FakeCoordinator,
+        key: str,
+        sensor_name: str,
+        icon: str,
+        expected: datetime,
+    ) -> None:
+        """Test native_value returns the start/end time for its key."""
         sensor = AdaptiveCoverTimeSensorEntity(
             unique_id=mock_cover_config_entry.entry_id,
-            hass=mock_hass,
+            hass=hass,
             config_entry=mock_cover_config_entry,
             name="Test Cover",
-            sensor_name="End Sun",
-            key="end",
-            icon="mdi:sun-clock",
+            sensor_name=sensor_name,
+            key=key,
+            icon=icon,
             coordinator=mock_cover_coordinator,
         )
 
-        assert sensor.native_value == datetime(2024, 6, 21, 20, 0, 0)
+        assert sensor.native_value == expected
 
-    def test_native_value_no_data(
+    @pytest.mark.parametrize(
+        ("key", "sensor_name"),
+        [("start", "Start Sun"), ("end", "End Sun")],
+    )
+    def test_no_data_returns_none(
         self,
-        mock_hass: HomeAssistant,
-        mock_cover_config_entry: MagicMock,
-        mock_cover_coordinator: MagicMock,
+        hass,
+        mock_cover_config_entry: SimpleNamespace,
+        mock_cover_coordinator: FakeCoordinator,
+        key: str,
+        sensor_name: str,
     ) -> None:
         """Test native_value returns None when no data."""
         mock_cover_coordinator.data = None
 
         sensor = AdaptiveCoverTimeSensorEntity(
             unique_id=mock_cover_config_entry.entry_id,
-            hass=mock_hass,
+            hass=hass,
             config_entry=mock_cover_config_entry,
             name="Test Cover",
-            sensor_name="Start Sun",
-            key="start",
+            sensor_name=sensor_name,
+            key=key,
             icon="mdi:sun-clock-outline",
             coordinator=mock_cover_coordinator,
         )
@@ -379,40 +365,20 @@ class TestAdaptiveCoverControlSensorEntity:
     """Tests for AdaptiveCoverControlSensorEntity (comfort status)."""
 
     @pytest.fixture
-    def mock_cover_coordinator(self) -> MagicMock:
+    def mock_cover_coordinator(self) -> FakeCoordinator:
         """Create mock AdaptiveDataUpdateCoordinator."""
-        coordinator = MagicMock()
-        coordinator.data = AdaptiveCoverData(
-            climate_mode_toggle=True,
-            states={"comfort_status": "comfortable"},
-            attributes={},
-        )
-        return coordinator
-
-    @pytest.fixture
-    def mock_cover_config_entry(self) -> MagicMock:
-        """Create mock ConfigEntry for cover."""
-        entry = MagicMock()
-        entry.entry_id = "test_cover_entry"
-        entry.data = {"name": "Test Cover"}
-        entry.options = {}
-        return entry
-
-    @pytest.fixture
-    def mock_hass(self, hass: HomeAssistant) -> HomeAssistant:
-        """Return Home Assistant instance."""
-        return hass
+        return FakeCoordinator(data=_COMFORT_DATA)
 
     def test_native_value(
         self,
-        mock_hass: HomeAssistant,
-        mock_cover_config_entry: MagicMock,
-        mock_cover_coordinator: MagicMock,
+        hass,
+        mock_cover_config_entry: SimpleNamespace,
+        mock_cover_coordinator: FakeCoordinator,
     ) -> None:
         """Test native_value returns comfort_status."""
         sensor = AdaptiveCoverControlSensorEntity(
             unique_id=mock_cover_config_entry.entry_id,
-            hass=mock_hass,
+            hass=hass,
             config_entry=mock_cover_config_entry,
             name="Test Cover",
             coordinator=mock_cover_coordinator,
@@ -422,16 +388,16 @@ class TestAdaptiveCoverControlSensorEntity:
 
     def test_native_value_no_data(
         self,
-        mock_hass: HomeAssistant,
-        mock_cover_config_entry: MagicMock,
-        mock_cover_coordinator: MagicMock,
+        hass,
+        mock_cover_config_entry: SimpleNamespace,
+        mock_cover_coordinator: FakeCoordinator,
     ) -> None:
         """Test native_value returns None when no data."""
         mock_cover_coordinator.data = None
 
         sensor = AdaptiveCoverControlSensorEntity(
             unique_id=mock_cover_config_entry.entry_id,
-            hass=mock_hass,
+            hass=hass,
             config_entry=mock_cover_config_entry,
             name="Test Cover",
             coordinator=mock_cover_coordinator,
@@ -444,36 +410,20 @@ class TestAdaptiveRoomComfortStatusSensorEntity:
     """Tests for AdaptiveRoomComfortStatusSensorEntity."""
 
     @pytest.fixture
-    def mock_room_coordinator(self) -> MagicMock:
+    def mock_room_coordinator(self) -> FakeCoordinator:
         """Create mock RoomCoordinator."""
-        coordinator = MagicMock()
-        coordinator.comfort_status = "comfortable"
-        return coordinator
-
-    @pytest.fixture
-    def mock_room_config_entry(self) -> MagicMock:
-        """Create mock ConfigEntry for room."""
-        entry = MagicMock()
-        entry.entry_id = "test_room_entry"
-        entry.data = {"name": "Test Room"}
-        entry.options = {}
-        return entry
-
-    @pytest.fixture
-    def mock_hass(self, hass: HomeAssistant) -> HomeAssistant:
-        """Return Home Assistant instance."""
-        return hass
+        return FakeCoordinator(comfort_status="comfortable")
 
     def test_native_value(
         self,
-        mock_hass: HomeAssistant,
-        mock_room_config_entry: MagicMock,
-        mock_room_coordinator: MagicMock,
+        hass,
+        mock_room_config_entry: SimpleNamespace,
+        mock_room_coordinator: FakeCoordinator,
     ) -> None:
         """Test native_value returns aggregated comfort_status."""
         sensor = AdaptiveRoomComfortStatusSensorEntity(
             unique_id=mock_room_config_entry.entry_id,
-            hass=mock_hass,
+            hass=hass,
             config_entry=mock_room_config_entry,
             name="Test Room",
             coordinator=mock_room_coordinator,
@@ -486,69 +436,29 @@ class TestAdaptiveCoverCloudSensorEntity:
     """Tests for AdaptiveCoverCloudSensorEntity."""
 
     @pytest.fixture
-    def mock_cover_coordinator(self) -> MagicMock:
+    def mock_cover_coordinator(self) -> FakeCoordinator:
         """Create mock AdaptiveDataUpdateCoordinator."""
-        coordinator = MagicMock()
-        coordinator.data = AdaptiveCoverData(
-            climate_mode_toggle=True,
-            states={"cloud_coverage": 25.0},
-            attributes={},
-        )
-        return coordinator
+        return FakeCoordinator(data=_CLOUD_DATA)
 
     @pytest.fixture
     def mock_room_coordinator(self) -> MagicMock:
         """Create mock RoomCoordinator."""
-        from custom_components.adaptive_cover.room_coordinator import RoomCoordinator
-
         coordinator = MagicMock(spec=RoomCoordinator)
-        coordinator.data = RoomData(
-            control_mode="auto",
-            lux_toggle=None,
-            irradiance_toggle=None,
-            cloud_toggle=None,
-            weather_toggle=None,
-            is_presence=True,
-            has_direct_sun=True,
-            last_known={"cloud": 30.0},
-        )
+        coordinator.data = _ROOM_DATA_WITH_CLOUD
         # Required for super().available check
         coordinator.last_update_success = True
         return coordinator
 
-    @pytest.fixture
-    def mock_cover_config_entry(self) -> MagicMock:
-        """Create mock ConfigEntry for cover."""
-        entry = MagicMock()
-        entry.entry_id = "test_cover_entry"
-        entry.data = {"name": "Test Cover"}
-        entry.options = {}
-        return entry
-
-    @pytest.fixture
-    def mock_room_config_entry(self) -> MagicMock:
-        """Create mock ConfigEntry for room."""
-        entry = MagicMock()
-        entry.entry_id = "test_room_entry"
-        entry.data = {"name": "Test Room"}
-        entry.options = {}
-        return entry
-
-    @pytest.fixture
-    def mock_hass(self, hass: HomeAssistant) -> HomeAssistant:
-        """Return Home Assistant instance."""
-        return hass
-
     def test_native_value_cover_coordinator(
         self,
-        mock_hass: HomeAssistant,
-        mock_cover_config_entry: MagicMock,
-        mock_cover_coordinator: MagicMock,
+        hass,
+        mock_cover_config_entry: SimpleNamespace,
+        mock_cover_coordinator: FakeCoordinator,
     ) -> None:
         """Test native_value with cover coordinator."""
         sensor = AdaptiveCoverCloudSensorEntity(
             unique_id=mock_cover_config_entry.entry_id,
-            hass=mock_hass,
+            hass=hass,
             config_entry=mock_cover_config_entry,
             name="Test Cover",
             coordinator=mock_cover_coordinator,
@@ -558,14 +468,14 @@ class TestAdaptiveCoverCloudSensorEntity:
 
     def test_native_value_room_coordinator(
         self,
-        mock_hass: HomeAssistant,
-        mock_room_config_entry: MagicMock,
+        hass,
+        mock_room_config_entry: SimpleNamespace,
         mock_room_coordinator: MagicMock,
     ) -> None:
         """Test native_value with room coordinator."""
         sensor = AdaptiveCoverCloudSensorEntity(
             unique_id=mock_room_config_entry.entry_id,
-            hass=mock_hass,
+            hass=hass,
             config_entry=mock_room_config_entry,
             name="Test Room",
             coordinator=mock_room_coordinator,
@@ -574,36 +484,42 @@ class TestAdaptiveCoverCloudSensorEntity:
 
         assert sensor.native_value == 30.0
 
-    def test_native_value_room_no_data(
+    @pytest.mark.parametrize(
+        ("attr", "expected"),
+        [("native_value", None), ("available", False)],
+    )
+    def test_room_no_data_returns_none(
         self,
-        mock_hass: HomeAssistant,
-        mock_room_config_entry: MagicMock,
+        hass,
+        mock_room_config_entry: SimpleNamespace,
         mock_room_coordinator: MagicMock,
+        attr: str,
+        expected: bool | None,
     ) -> None:
-        """Test native_value returns None when room has no data."""
+        """Test properties fall back to None/False when room has no data."""
         mock_room_coordinator.data = None
 
         sensor = AdaptiveCoverCloudSensorEntity(
             unique_id=mock_room_config_entry.entry_id,
-            hass=mock_hass,
+            hass=hass,
             config_entry=mock_room_config_entry,
             name="Test Room",
             coordinator=mock_room_coordinator,
             is_room=True,
         )
 
-        assert sensor.native_value is None
+        assert getattr(sensor, attr) == expected
 
     def test_available_cover_coordinator(
         self,
-        mock_hass: HomeAssistant,
-        mock_cover_config_entry: MagicMock,
-        mock_cover_coordinator: MagicMock,
+        hass,
+        mock_cover_config_entry: SimpleNamespace,
+        mock_cover_coordinator: FakeCoordinator,
     ) -> None:
         """Test available with cover coordinator."""
         sensor = AdaptiveCoverCloudSensorEntity(
             unique_id=mock_cover_config_entry.entry_id,
-            hass=mock_hass,
+            hass=hass,
             config_entry=mock_cover_config_entry,
             name="Test Cover",
             coordinator=mock_cover_coordinator,
@@ -613,20 +529,16 @@ class TestAdaptiveCoverCloudSensorEntity:
 
     def test_available_cover_coordinator_no_cloud(
         self,
-        mock_hass: HomeAssistant,
-        mock_cover_config_entry: MagicMock,
-        mock_cover_coordinator: MagicMock,
+        hass,
+        mock_cover_config_entry: SimpleNamespace,
+        mock_cover_coordinator: FakeCoordinator,
     ) -> None:
         """Test available returns False when no cloud data."""
-        mock_cover_coordinator.data = AdaptiveCoverData(
-            climate_mode_toggle=True,
-            states={},
-            attributes={},
-        )
+        mock_cover_coordinator.data = replace(_CLOUD_DATA, states={})
 
         sensor = AdaptiveCoverCloudSensorEntity(
             unique_id=mock_cover_config_entry.entry_id,
-            hass=mock_hass,
+            hass=hass,
             config_entry=mock_cover_config_entry,
             name="Test Cover",
             coordinator=mock_cover_coordinator,
@@ -636,14 +548,14 @@ class TestAdaptiveCoverCloudSensorEntity:
 
     def test_available_room_coordinator(
         self,
-        mock_hass: HomeAssistant,
-        mock_room_config_entry: MagicMock,
+        hass,
+        mock_room_config_entry: SimpleNamespace,
         mock_room_coordinator: MagicMock,
     ) -> None:
         """Test available with room coordinator."""
         sensor = AdaptiveCoverCloudSensorEntity(
             unique_id=mock_room_config_entry.entry_id,
-            hass=mock_hass,
+            hass=hass,
             config_entry=mock_room_config_entry,
             name="Test Room",
             coordinator=mock_room_coordinator,
@@ -654,27 +566,18 @@ class TestAdaptiveCoverCloudSensorEntity:
 
     def test_available_room_coordinator_no_cloud(
         self,
-        mock_hass: HomeAssistant,
-        mock_room_config_entry: MagicMock,
+        hass,
+        mock_room_config_entry: SimpleNamespace,
         mock_room_coordinator: MagicMock,
     ) -> None:
         """Test available returns False when room has no cloud data."""
-        mock_room_coordinator.data = RoomData(
-            control_mode="auto",
-            lux_toggle=None,
-            irradiance_toggle=None,
-            cloud_toggle=None,
-            weather_toggle=None,
-            is_presence=True,
-            has_direct_sun=True,
-            last_known={},
-        )
+        mock_room_coordinator.data = _ROOM_DATA_EMPTY
         # Ensure last_update_success is still set
         mock_room_coordinator.last_update_success = True
 
         sensor = AdaptiveCoverCloudSensorEntity(
             unique_id=mock_room_config_entry.entry_id,
-            hass=mock_hass,
+            hass=hass,
             config_entry=mock_room_config_entry,
             name="Test Room",
             coordinator=mock_room_coordinator,
@@ -685,14 +588,14 @@ class TestAdaptiveCoverCloudSensorEntity:
 
     def test_device_info_room(
         self,
-        mock_hass: HomeAssistant,
-        mock_room_config_entry: MagicMock,
+        hass,
+        mock_room_config_entry: SimpleNamespace,
         mock_room_coordinator: MagicMock,
     ) -> None:
         """Test device_info for room cloud sensor."""
         sensor = AdaptiveCoverCloudSensorEntity(
             unique_id=mock_room_config_entry.entry_id,
-            hass=mock_hass,
+            hass=hass,
             config_entry=mock_room_config_entry,
             name="Test Room",
             coordinator=mock_room_coordinator,
@@ -700,27 +603,27 @@ class TestAdaptiveCoverCloudSensorEntity:
         )
 
         device_info = sensor.device_info
-        identifiers = list(device_info["identifiers"])[0]
+        identifiers = next(iter(device_info["identifiers"]))
         assert identifiers[0] == DOMAIN
         assert identifiers[1] == "room_test_room_entry"
 
     def test_device_info_standalone(
         self,
-        mock_hass: HomeAssistant,
-        mock_cover_config_entry: MagicMock,
-        mock_cover_coordinator: MagicMock,
+        hass,
+        mock_cover_config_entry: SimpleNamespace,
+        mock_cover_coordinator: FakeCoordinator,
     ) -> None:
         """Test device_info for standalone cloud sensor."""
         sensor = AdaptiveCoverCloudSensorEntity(
             unique_id=mock_cover_config_entry.entry_id,
-            hass=mock_hass,
+            hass=hass,
             config_entry=mock_cover_config_entry,
             name="Test Cover",
             coordinator=mock_cover_coordinator,
         )
 
         device_info = sensor.device_info
-        identifiers = list(device_info["identifiers"])[0]
+        identifiers = next(iter(device_info["identifiers"]))
         assert identifiers[0] == DOMAIN
         assert identifiers[1] == "test_cover_entry"
 
@@ -729,282 +632,215 @@ class TestSensorAsyncSetupEntry:
     """Tests for sensor async_setup_entry function."""
 
     @pytest.fixture
-    def mock_room_coordinator(self, mock_room_config_entry: MagicMock) -> MagicMock:
-        """Create mock RoomCoordinator."""
-        from custom_components.adaptive_cover.room_coordinator import RoomCoordinator
-
+    def domain_data(self, hass) -> dict:
+        """Return hass.data[DOMAIN], creating it if missing."""
+        return hass.data.setdefault(DOMAIN, {})
+
+    @pytest.fixture(scope="class")
+    def mock_room_coordinator(
+        self, setup_room_config_entry: SimpleNamespace
+    ) -> MagicMock:
+        """Create mock RoomCoordinator, shared since no setup test mutates it."""
         coordinator = MagicMock(spec=RoomCoordinator)
-        coordinator.data = RoomData(
-            control_mode="auto",
-            lux_toggle=None,
-            irradiance_toggle=None,
-            cloud_toggle=None,
-            weather_toggle=None,
-            is_presence=True,
-            has_direct_sun=True,
-            last_known={"cloud": 30.0},
-        )
+        coordinator.data = _ROOM_DATA_WITH_CLOUD
         coordinator.comfort_status = "comfortable"
         coordinator.last_update_success = True
         coordinator._child_coordinators = []
-        coordinator.config_entry = mock_room_config_entry
+        coordinator.config_entry = setup_room_config_entry
         return coordinator
 
     @pytest.fixture
-    def mock_cover_coordinator(self) -> MagicMock:
+    def mock_cover_coordinator(self) -> FakeCoordinator:
         """Create mock AdaptiveDataUpdateCoordinator."""
-        coordinator = MagicMock()
-        coordinator.data = AdaptiveCoverData(
-            climate_mode_toggle=True,
-            states={
-                "state": 50,
-                "start": datetime(2024, 6, 21, 8, 0, 0),
-                "end": datetime(2024, 6, 21, 20, 0, 0),
-                "comfort_status": "comfortable",
-                "cloud_coverage": 25.0,
-            },
-            attributes={"azimuth": 180, "fov": [90, 270]},
-        )
-        coordinator.control_mode = CONTROL_MODE_AUTO
-        return coordinator
+        return FakeCoordinator(data=_SETUP_DATA, control_mode=CONTROL_MODE_AUTO)
 
-    @pytest.fixture
-    def mock_room_config_entry(self) -> MagicMock:
-        """Create mock ConfigEntry for room."""
-        entry = MagicMock()
-        entry.entry_id = "test_room_entry"
-        entry.data = {"name": "Test Room", CONF_ENTRY_TYPE: EntryType.ROOM}
-        entry.options = {
-            CONF_TEMP_ENTITY: "sensor.inside_temp",
-        }
-        return entry
+    @pytest.fixture(scope="class")
+    def setup_room_config_entry(self) -> SimpleNamespace:
+        """Create a read-only ConfigEntry stand-in for room setup.
+
+        Class-scoped for the shared room coordinator, so it holds no mutable
+        data and its unload hook keeps no call history.
+        """
+        return SimpleNamespace(
+            entry_id="test_room_entry",
+            data=MappingProxyType(
+                {"name": "Test Room", CONF_ENTRY_TYPE: EntryType.ROOM}
+            ),
+            options=_TEMP_OPTIONS,
+            # Room setup registers a dispatcher unsubscribe callback
+            async_on_unload=lambda unsub: None,
+        )
 
     @pytest.fixture
-    def mock_room_config_entry_with_cloud(self) -> MagicMock:
+    def mock_room_config_entry_with_cloud(self) -> SimpleNamespace:
         """Create mock ConfigEntry for room with cloud entity."""
-        entry = MagicMock()
-        entry.entry_id = "test_room_entry"
-        entry.data = {"name": "Test Room", CONF_ENTRY_TYPE: EntryType.ROOM}
-        entry.options = {
-            CONF_CLOUD_ENTITY: "sensor.cloud",
-            CONF_TEMP_ENTITY: "sensor.inside_temp",
-        }
-        return entry
+        return SimpleNamespace(
+            entry_id="test_room_entry",
+            data={"name": "Test Room", CONF_ENTRY_TYPE: EntryType.ROOM},
+            options=_CLOUD_TEMP_OPTIONS,
+            # Room setup registers a dispatcher unsubscribe callback
+            async_on_unload=MagicMock(),
+        )
 
     @pytest.fixture
-    def mock_standalone_cover_config_entry(self) -> MagicMock:
+    def mock_standalone_cover_config_entry(self) -> SimpleNamespace:
         """Create mock ConfigEntry for standalone cover."""
-        entry = MagicMock()
-        entry.entry_id = "test_cover_entry"
-        entry.data = {"name": "Test Cover", CONF_ENTRY_TYPE: EntryType.COVER}
-        entry.options = {
-            CONF_TEMP_ENTITY: "sensor.inside_temp",
-        }
-        return entry
+        return SimpleNamespace(
+            entry_id="test_cover_entry",
+            data={"name": "Test Cover", CONF_ENTRY_TYPE: EntryType.COVER},
+            options=_TEMP_OPTIONS,
+        )
 
     @pytest.fixture
-    def mock_standalone_cover_with_cloud_config_entry(self) -> MagicMock:
+    def mock_standalone_cover_with_cloud_config_entry(self) -> SimpleNamespace:
         """Create mock ConfigEntry for standalone cover with cloud entity."""
-        entry = MagicMock()
-        entry.entry_id = "test_cover_entry"
-        entry.data = {"name": "Test Cover", CONF_ENTRY_TYPE: EntryType.COVER}
-        entry.options = {
-            CONF_CLOUD_ENTITY: "sensor.cloud",
-            CONF_TEMP_ENTITY: "sensor.inside_temp",
-        }
-        return entry
+        return SimpleNamespace(
+            entry_id="test_cover_entry",
+            data={"name": "Test Cover", CONF_ENTRY_TYPE: EntryType.COVER},
+            options=_CLOUD_TEMP_OPTIONS,
+        )
 
     @pytest.fixture
-    def mock_cover_in_room_config_entry(self) -> MagicMock:
+    def mock_cover_in_room_config_entry(self) -> SimpleNamespace:
         """Create mock ConfigEntry for cover in room."""
-        entry = MagicMock()
-        entry.entry_id = "test_cover_in_room_entry"
-        entry.data = {
-            "name": "Test Cover in Room",
-            CONF_ENTRY_TYPE: EntryType.COVER,
-            CONF_ROOM_ID: "room_123",
-        }
-        entry.options = {}
-        return entry
-
-    @pytest.mark.asyncio
+        return SimpleNamespace(
+            entry_id="test_cover_in_room_entry",
+            data={
+                "name": "Test Cover in Room",
+                CONF_ENTRY_TYPE: EntryType.COVER,
+                CONF_ROOM_ID: "room_123",
+            },
+            options=_EMPTY_OPTIONS,
+        )
+
     async def test_setup_room_entry_creates_sensors_and_comfort_status(
         self,
         hass,
-        mock_room_config_entry: MagicMock,
+        domain_data: dict,
+        setup_room_config_entry: SimpleNamespace,
         mock_room_coordinator: MagicMock,
     ) -> None:
         """Test async_setup_entry creates sensors for room."""
-        hass.data[DOMAIN] = {mock_room_config_entry.entry_id: mock_room_coordinator}
-
-        entities_added = []
-
-        def add_entities(entities):
-            entities_added.extend(entities)
-
-        await async_setup_entry(hass, mock_room_config_entry, add_entities)
+        domain_data[setup_room_config_entry.entry_id] = mock_room_coordinator
+        entities_added = await _collect_entities(hass, setup_room_config_entry)
 
         # Room gets: Comfort Status (no cloud, no outside temp)
         assert len(entities_added) == 1
 
-        entity_types = [type(e).__name__ for e in entities_added]
+        entity_types = {type(e).__name__ for e in entities_added}
         assert "AdaptiveRoomComfortStatusSensorEntity" in entity_types
 
-    @pytest.mark.asyncio
     async def test_setup_room_entry_with_cloud_creates_cloud_sensor(
         self,
         hass,
-        mock_room_config_entry_with_cloud: MagicMock,
+        domain_data: dict,
+        mock_room_config_entry_with_cloud: SimpleNamespace,
         mock_room_coordinator: MagicMock,
     ) -> None:
         """Test async_setup_entry creates cloud sensor for room with cloud entity."""
-        hass.data[DOMAIN] = {
-            mock_room_config_entry_with_cloud.entry_id: mock_room_coordinator
-        }
-
-        entities_added = []
-
-        def add_entities(entities):
-            entities_added.extend(entities)
-
-        await async_setup_entry(hass, mock_room_config_entry_with_cloud, add_entities)
+        domain_data[mock_room_config_entry_with_cloud.entry_id] = mock_room_coordinator
+        entities_added = await _collect_entities(
+            hass, mock_room_config_entry_with_cloud
+        )
 
         # Room with cloud gets: Cloud, Comfort Status
         assert len(entities_added) == 2
 
-        entity_types = [type(e).__name__ for e in entities_added]
+        entity_types = {type(e).__name__ for e in entities_added}
         assert "AdaptiveCoverCloudSensorEntity" in entity_types
 
-    @pytest.mark.asyncio
     async def test_setup_standalone_cover_creates_position_sensor(
         self,
         hass,
-        mock_standalone_cover_config_entry: MagicMock,
-        mock_cover_coordinator: MagicMock,
+        domain_data: dict,
+        mock_standalone_cover_config_entry: SimpleNamespace,
+        mock_cover_coordinator: FakeCoordinator,
     ) -> None:
         """Test async_setup_entry creates position sensor for standalone cover."""
-        hass.data[DOMAIN] = {
-            mock_standalone_cover_config_entry.entry_id: mock_cover_coordinator
-        }
-
-        entities_added = []
-
-        def add_entities(entities):
-            entities_added.extend(entities)
-
-        await async_setup_entry(hass, mock_standalone_cover_config_entry, add_entities)
+        domain_data[mock_standalone_cover_config_entry.entry_id] = (
+            mock_cover_coordinator
+        )
+        entities_added = await _collect_entities(
+            hass, mock_standalone_cover_config_entry
+        )
 
         # Standalone cover gets: Position, Start Sun, End Sun, Comfort Status (no cloud)
         assert len(entities_added) == 4
 
-        entity_types = [type(e).__name__ for e in entities_added]
-        assert "AdaptiveCoverSensorEntity" in entity_types
-        assert "AdaptiveCoverTimeSensorEntity" in entity_types
-        assert "AdaptiveCoverControlSensorEntity" in entity_types
+        entity_types = {type(e).__name__ for e in entities_added}
+        assert {
+            "AdaptiveCoverSensorEntity",
+            "AdaptiveCoverTimeSensorEntity",
+            "AdaptiveCoverControlSensorEntity",
+        } <= entity_types
 
-    @pytest.mark.asyncio
     async def test_setup_standalone_cover_with_cloud_creates_cloud_sensor(
         self,
         hass,
-        mock_standalone_cover_with_cloud_config_entry: MagicMock,
-        mock_cover_coordinator: MagicMock,
+        domain_data: dict,
+        mock_standalone_cover_with_cloud_config_entry: SimpleNamespace,
+        mock_cover_coordinator: FakeCoordinator,
     ) -> None:
         """Test async_setup_entry creates cloud sensor for standalone cover with cloud."""
-        hass.data[DOMAIN] = {
-            mock_standalone_cover_with_cloud_config_entry.entry_id: mock_cover_coordinator
-        }
-
-        entities_added = []
-
-        def add_entities(entities):
-            entities_added.extend(entities)
-
-        await async_setup_entry(
-            hass, mock_standalone_cover_with_cloud_config_entry, add_entities
+        domain_data[mock_standalone_cover_with_cloud_config_entry.entry_id] = (
+            mock_cover_coordinator
+        )
+        entities_added = await _collect_entities(
+            hass, mock_standalone_cover_with_cloud_config_entry
         )
 
         # Standalone cover with cloud gets: Position, Start, End, Comfort, Cloud
         assert len(entities_added) == 5
 
-        entity_types = [type(e).__name__ for e in entities_added]
+        entity_types = {type(e).__name__ for e in entities_added}
         assert "AdaptiveCoverCloudSensorEntity" in entity_types
 
-    @pytest.mark.asyncio
     async def test_setup_cover_in_room_creates_sensors(
         self,
         hass,
-        mock_cover_in_room_config_entry: MagicMock,
-        mock_cover_coordinator: MagicMock,
+        domain_data: dict,
+        mock_cover_in_room_config_entry: SimpleNamespace,
+        mock_cover_coordinator: FakeCoordinator,
     ) -> None:
         """Test async_setup_entry creates sensors for cover in room."""
-        hass.data[DOMAIN] = {
-            mock_cover_in_room_config_entry.entry_id: mock_cover_coordinator
-        }
-
-        entities_added = []
-
-        def add_entities(entities):
-            entities_added.extend(entities)
-
-        await async_setup_entry(hass, mock_cover_in_room_config_entry, add_entities)
+        domain_data[mock_cover_in_room_config_entry.entry_id] = mock_cover_coordinator
+        entities_added = await _collect_entities(hass, mock_cover_in_room_config_entry)
 
         # Cover in room gets: Position, Start, End time sensors
         # (no proxy sensors without room_coordinator in hass.data)
         assert len(entities_added) == 3
 
-        entity_types = [type(e).__name__ for e in entities_added]
-        assert "AdaptiveCoverSensorEntity" in entity_types
-        assert "AdaptiveCoverTimeSensorEntity" in entity_types
+        entity_types = {type(e).__name__ for e in entities_added}
+        assert {
+            "AdaptiveCoverSensorEntity",
+            "AdaptiveCoverTimeSensorEntity",
+        } <= entity_types
 
         # Verify position sensor knows it's in a room
-        position_sensors = [
-            e for e in entities_added if type(e).__name__ == "AdaptiveCoverSensorEntity"
-        ]
-        assert position_sensors[0]._room_id == "room_123"
+        position_sensor = next(
+            e for e in entities_added if isinstance(e, AdaptiveCoverSensorEntity)
+        )
+        assert position_sensor._room_id == "room_123"
 
 
 class TestTimeSensorEntityDeviceInfoWithRoom:
     """Tests for time sensor device info with room_id."""
 
     @pytest.fixture
-    def mock_cover_coordinator(self) -> MagicMock:
+    def mock_cover_coordinator(self) -> FakeCoordinator:
         """Create mock AdaptiveDataUpdateCoordinator."""
-        coordinator = MagicMock()
-        coordinator.data = AdaptiveCoverData(
-            climate_mode_toggle=True,
-            states={
-                "state": 50,
-                "start": datetime(2024, 6, 21, 8, 0, 0),
-                "end": datetime(2024, 6, 21, 20, 0, 0),
-            },
-            attributes={},
-        )
-        return coordinator
-
-    @pytest.fixture
-    def mock_cover_config_entry(self) -> MagicMock:
-        """Create mock ConfigEntry for cover."""
-        entry = MagicMock()
-        entry.entry_id = "test_cover_entry"
-        entry.data = {"name": "Test Cover"}
-        entry.options = {}
-        return entry
-
-    @pytest.fixture
-    def mock_hass(self, hass) -> MagicMock:
-        """Return Home Assistant instance."""
-        return hass
+        return FakeCoordinator(data=_TIME_DATA)
 
     def test_time_sensor_device_info_with_room_id(
         self,
-        mock_hass,
-        mock_cover_config_entry: MagicMock,
-        mock_cover_coordinator: MagicMock,
+        hass,
+        mock_cover_config_entry: SimpleNamespace,
+        mock_cover_coordinator: FakeCoordinator,
     ) -> None:
         """Test device_info includes via_device when room_id is set."""
         sensor = AdaptiveCoverTimeSensorEntity(
             unique_id=mock_cover_config_entry.entry_id,
-            hass=mock_hass,
+            hass=hass,
             config_entry=mock_cover_config_entry,
             name="Test Cover",
             sensor_name="Start Sun",
@@ -1020,14 +856,14 @@ class TestTimeSensorEntityDeviceInfoWithRoom:
 
     def test_time_sensor_name_includes_cover_name_with_room_id(
         self,
-        mock_hass,
-        mock_cover_config_entry: MagicMock,
-        mock_cover_coordinator: MagicMock,
+        hass,
+        mock_cover_config_entry: SimpleNamespace,
+        mock_cover_coordinator: FakeCoordinator,
     ) -> None:
         """Test sensor name includes cover name when room_id is set."""
         sensor = AdaptiveCoverTimeSensorEntity(
             unique_id=mock_cover_config_entry.entry_id,
-            hass=mock_hass,
+            hass=hass,
             config_entry=mock_cover_config_entry,
             name="Test Cover",
             sensor_name="Start Sun",
@@ -1045,40 +881,20 @@ class TestControlSensorEntityWithRoom:
     """Tests for control sensor device info with room_id."""
 
     @pytest.fixture
-    def mock_cover_coordinator(self) -> MagicMock:
+    def mock_cover_coordinator(self) -> FakeCoordinator:
         """Create mock AdaptiveDataUpdateCoordinator."""
-        coordinator = MagicMock()
-        coordinator.data = AdaptiveCoverData(
-            climate_mode_toggle=True,
-            states={"comfort_status": "comfortable"},
-            attributes={},
-        )
-        return coordinator
-
-    @pytest.fixture
-    def mock_cover_config_entry(self) -> MagicMock:
-        """Create mock ConfigEntry for cover."""
-        entry = MagicMock()
-        entry.entry_id = "test_cover_entry"
-        entry.data = {"name": "Test Cover"}
-        entry.options = {}
-        return entry
-
-    @pytest.fixture
-    def mock_hass(self, hass) -> MagicMock:
-        """Return Home Assistant instance."""
-        return hass
+        return FakeCoordinator(data=_COMFORT_DATA)
 
     def test_control_sensor_device_info_with_room_id(
         self,
-        mock_hass,
-        mock_cover_config_entry: MagicMock,
-        mock_cover_coordinator: MagicMock,
+        hass,
+        mock_cover_config_entry: SimpleNamespace,
+        mock_cover_coordinator: FakeCoordinator,
     ) -> None:
         """Test device_info includes via_device when room_id is set."""
         sensor = AdaptiveCoverControlSensorEntity(
             unique_id=mock_cover_config_entry.entry_id,
-            hass=mock_hass,
+            hass=hass,
             config_entry=mock_cover_config_entry,
             name="Test Cover",
             coordinator=mock_cover_coordinator,
@@ -1091,14 +907,14 @@ class TestControlSensorEntityWithRoom:
 
     def test_control_sensor_name_includes_cover_name_with_room_id(
         self,
-        mock_hass,
-        mock_cover_config_entry: MagicMock,
-        mock_cover_coordinator: MagicMock,
+        hass,
+        mock_cover_config_entry: SimpleNamespace,
+        mock_cover_coordinator: FakeCoordinator,
     ) -> None:
         """Test sensor name includes cover name when room_id is set."""
         sensor = AdaptiveCoverControlSensorEntity(
             unique_id=mock_cover_config_entry.entry_id,
-            hass=mock_hass,
+            hass=hass,
             config_entry=mock_cover_config_entry,
             name="Test Cover",
             coordinator=mock_cover_coordinator,
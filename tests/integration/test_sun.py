@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
-from datetime import date
+from collections.abc import Iterator
+from datetime import date, datetime
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pandas as pd
+import pytest
+from astral import LocationInfo
+from astral.location import Location
+
+from custom_components.adaptive_cover.sun import SunData, _solar_position
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -15,153 +22,166 @@ if TYPE_CHECKING:
 class TestSunData:
     """Tests for SunData class."""
 
-    def test_times_returns_datetime_index(self, hass: HomeAssistant) -> None:
-        """Test that times property returns a DatetimeIndex."""
+    @pytest.fixture(autouse=True)
+    def mock_get_astral_location(self) -> Iterator[MagicMock]:
+        """Patch get_astral_location to return a configurable mock location."""
         with patch(
             "custom_components.adaptive_cover.sun.get_astral_location"
         ) as mock_astral:
-            mock_location = MagicMock()
-            mock_astral.return_value = (mock_location, 0)
+            mock_astral.return_value = (
+                MagicMock(latitude=52.37, longitude=4.89),
+                0,
+            )
+            yield mock_astral
 
-            from custom_components.adaptive_cover.sun import SunData
+    @pytest.fixture
+    def mock_location(self, mock_get_astral_location: MagicMock) -> MagicMock:
+        """Return the mock location SunData receives."""
+        return mock_get_astral_location.return_value[0]
 
-            sun_data = SunData("Europe/Amsterdam", hass)
-            times = sun_data.times
+    def test_times_returns_datetime_index(self, hass: HomeAssistant) -> None:
+        """Test that times property returns a DatetimeIndex."""
+        sun_data = SunData("Europe/Amsterdam", hass)
+        times = sun_data.times
 
-            assert isinstance(times, pd.DatetimeIndex)
-            # Should cover at least one full day with 5-minute intervals
-            # 24 hours * 60 minutes / 5 = 288 intervals
-            assert len(times) >= 288
+        assert isinstance(times, pd.DatetimeIndex)
+        # Should cover at least one full day with 5-minute intervals
+        # 24 hours * 60 minutes / 5 = 288 intervals
+        assert len(times) >= 288
 
     def test_times_has_5_minute_frequency(self, hass: HomeAssistant) -> None:
         """Test that times are spaced 5 minutes apart."""
-        with patch(
-            "custom_components.adaptive_cover.sun.get_astral_location"
-        ) as mock_astral:
-            mock_location = MagicMock()
-            mock_astral.return_value = (mock_location, 0)
+        sun_data = SunData("Europe/Amsterdam", hass)
+        times = sun_data.times
 
-            from custom_components.adaptive_cover.sun import SunData
+        # Check frequency between consecutive times
+        if len(times) >= 2:
+            diff = times[1] - times[0]
+            assert diff == pd.Timedelta(minutes=5)
 
-            sun_data = SunData("Europe/Amsterdam", hass)
-            times = sun_data.times
+    def test_times_shared_across_instances(self, hass: HomeAssistant) -> None:
+        """Test that the daily grid is built once and reused."""
+        first = SunData("Europe/Amsterdam", hass)
+        second = SunData("Europe/Amsterdam", hass)
 
-            # Check frequency between consecutive times
-            if len(times) >= 2:
-                diff = times[1] - times[0]
-                assert diff == pd.Timedelta(minutes=5)
+        assert first.times is second.times
+        assert SunData("UTC", hass).times is not first.times
 
     def test_solar_azimuth_returns_list(self, hass: HomeAssistant) -> None:
         """Test that solar_azimuth returns a list of values."""
-        with patch(
-            "custom_components.adaptive_cover.sun.get_astral_location"
-        ) as mock_astral:
-            mock_location = MagicMock()
-            mock_location.solar_azimuth.return_value = 180.0
-            mock_astral.return_value = (mock_location, 0)
-
-            from custom_components.adaptive_cover.sun import SunData
-
-            sun_data = SunData("Europe/Amsterdam", hass)
-            azimuths = sun_data.solar_azimuth
+        sun_data = SunData("Europe/Amsterdam", hass)
+        azimuths = sun_data.solar_azimuth
 
-            assert isinstance(azimuths, list)
-            assert len(azimuths) == len(sun_data.times)
-            assert all(isinstance(a, float) for a in azimuths)
+        assert isinstance(azimuths, list)
+        assert len(azimuths) == len(sun_data.times)
+        assert np.asarray(azimuths).dtype == np.float64
 
     def test_solar_elevation_returns_list(self, hass: HomeAssistant) -> None:
         """Test that solar_elevation returns a list of values."""
-        with patch(
-            "custom_components.adaptive_cover.sun.get_astral_location"
-        ) as mock_astral:
-            mock_location = MagicMock()
-            mock_location.solar_elevation.return_value = 45.0
-            mock_astral.return_value = (mock_location, 0)
+        sun_data = SunData("Europe/Amsterdam", hass)
+        elevations = sun_data.solar_elevation
 
-            from custom_components.adaptive_cover.sun import SunData
+        assert isinstance(elevations, list)
+        assert len(elevations) == len(sun_data.times)
+        assert np.asarray(elevations).dtype == np.float64
 
-            sun_data = SunData("Europe/Amsterdam", hass)
-            elevations = sun_data.solar_elevation
+    def test_solar_position_computed_once(self, hass: HomeAssistant) -> None:
+        """Test that azimuth and elevation share one solar position pass."""
+        sun_data = SunData("Europe/Amsterdam", hass)
+        with patch(
+            "custom_components.adaptive_cover.sun._solar_position",
+            wraps=_solar_position,
+        ) as mock_position:
+            sun_data.solar_azimuth
+            sun_data.solar_elevation
 
-            assert isinstance(elevations, list)
-            assert len(elevations) == len(sun_data.times)
-            assert all(isinstance(e, float) for e in elevations)
+        mock_position.assert_called_once()
 
-    def test_sunset_returns_datetime(self, hass: HomeAssistant) -> None:
+    def test_sunset_returns_datetime(
+        self, hass: HomeAssistant, mock_location: MagicMock
+    ) -> None:
         """Test that sunset returns a datetime."""
-        from datetime import datetime
+        expected_sunset = datetime(2024, 6, 21, 21, 30, 0)
+        mock_location.sunset.return_value = expected_sunset
 
-        with patch(
-            "custom_components.adaptive_cover.sun.get_astral_location"
-        ) as mock_astral:
-            mock_location = MagicMock()
-            expected_sunset = datetime(2024, 6, 21, 21, 30, 0)
-            mock_location.sunset.return_value = expected_sunset
-            mock_astral.return_value = (mock_location, 0)
-
-            from custom_components.adaptive_cover.sun import SunData
-
-            sun_data = SunData("Europe/Amsterdam", hass)
-            sunset = sun_data.sunset()
+        sun_data = SunData("Europe/Amsterdam", hass)
+        sunset = sun_data.sunset()
 
-            assert sunset == expected_sunset
-            mock_location.sunset.assert_called_once_with(date.today(), local=False)
+        assert sunset == expected_sunset
+        mock_location.sunset.assert_called_once_with(date.today(), local=False)
 
-    def test_sunrise_returns_datetime(self, hass: HomeAssistant) -> None:
+    def test_sunrise_returns_datetime(
+        self, hass: HomeAssistant, mock_location: MagicMock
+    ) -> None:
         """Test that sunrise returns a datetime."""
-        from datetime import datetime
+        expected_sunrise = datetime(2024, 6, 21, 5, 15, 0)
+        mock_location.sunrise.return_value = expected_sunrise
 
-        with patch(
-            "custom_components.adaptive_cover.sun.get_astral_location"
-        ) as mock_astral:
-            mock_location = MagicMock()
-            expected_sunrise = datetime(2024, 6, 21, 5, 15, 0)
-            mock_location.sunrise.return_value = expected_sunrise
-            mock_astral.return_value = (mock_location, 0)
+        sun_data = SunData("Europe/Amsterdam", hass)
+        sunrise = sun_data.sunrise()
 
-            from custom_components.adaptive_cover.sun import SunData
+        assert sunrise == expected_sunrise
+        mock_location.sunrise.assert_called_once_with(date.today(), local=False)
 
-            sun_data = SunData("Europe/Amsterdam", hass)
-            sunrise = sun_data.sunrise()
+    def test_sunset_and_sunrise_computed_once_per_day(
+        self, hass: HomeAssistant, mock_location: MagicMock
+    ) -> None:
+        """Test that repeated sunset/sunrise calls on the same day reuse results."""
+        sun_data = SunData("Europe/Amsterdam", hass)
+        for _ in range(3):
+            sun_data.sunset()
+            sun_data.sunrise()
 
-            assert sunrise == expected_sunrise
-            mock_location.sunrise.assert_called_once_with(date.today(), local=False)
+        mock_location.sunset.assert_called_once_with(date.today(), local=False)
+        mock_location.sunrise.assert_called_once_with(date.today(), local=False)
 
-    def test_stores_location_and_elevation(self, hass: HomeAssistant) -> None:
-        """Test that location and elevation are stored."""
-        with patch(
-            "custom_components.adaptive_cover.sun.get_astral_location"
-        ) as mock_astral:
-            mock_location = MagicMock()
-            expected_elevation = 100
-            mock_astral.return_value = (mock_location, expected_elevation)
-
-            from custom_components.adaptive_cover.sun import SunData
+    def test_sunset_and_sunrise_accept_explicit_date(
+        self, hass: HomeAssistant, mock_location: MagicMock
+    ) -> None:
+        """Test that an injected date is passed through to astral."""
+        day = date(2024, 6, 21)
 
-            sun_data = SunData("Europe/Amsterdam", hass)
+        sun_data = SunData("Europe/Amsterdam", hass)
+        sun_data.sunset(day)
+        sun_data.sunrise(day)
 
-            assert sun_data.location is mock_location
-            assert sun_data.elevation == expected_elevation
-            assert sun_data.timezone == "Europe/Amsterdam"
+        mock_location.sunset.assert_called_once_with(day, local=False)
+        mock_location.sunrise.assert_called_once_with(day, local=False)
 
-    def test_solar_azimuth_calls_location_method_for_each_time(
-        self, hass: HomeAssistant
+    def test_stores_location_and_elevation(
+        self,
+        hass: HomeAssistant,
+        mock_get_astral_location: MagicMock,
+        mock_location: MagicMock,
     ) -> None:
-        """Test that solar_azimuth calls location method for each time point."""
-        with patch(
-            "custom_components.adaptive_cover.sun.get_astral_location"
-        ) as mock_astral:
-            mock_location = MagicMock()
-            mock_location.solar_azimuth.return_value = 180.0
-            mock_astral.return_value = (mock_location, 50)
+        """Test that location and elevation are stored."""
+        expected_elevation = 100
+        mock_get_astral_location.return_value = (mock_location, expected_elevation)
 
-            from custom_components.adaptive_cover.sun import SunData
+        sun_data = SunData("Europe/Amsterdam", hass)
 
-            sun_data = SunData("Europe/Amsterdam", hass)
-            _azimuths = sun_data.solar_azimuth
+        assert sun_data.location is mock_location
+        assert sun_data.elevation == expected_elevation
+        assert sun_data.timezone == "Europe/Amsterdam"
 
-            # Should be called once for each time point
-            assert mock_location.solar_azimuth.call_count == len(sun_data.times)
-            # Each call should include elevation parameter
-            for call in mock_location.solar_azimuth.call_args_list:
-                assert call[0][1] == 50  # elevation parameter
+    def test_solar_position_matches_astral(
+        self, hass: HomeAssistant, mock_get_astral_location: MagicMock
+    ) -> None:
+        """Test vectorized azimuth/elevation match astral's per-time results."""
+        location = Location(
+            LocationInfo("Amsterdam", "NL", "Europe/Amsterdam", 52.37, 4.89)
+        )
+        mock_get_astral_location.return_value = (location, 50)
+
+        sun_data = SunData("Europe/Amsterdam", hass)
+        azimuths = sun_data.solar_azimuth
+        elevations = sun_data.solar_elevation
+
+        for t, azimuth, elevation in zip(
+            sun_data.times, azimuths, elevations, strict=True
+        ):
+            # Compare on the circle: near solar midnight azimuth wraps 0/360
+            assert (azimuth - location.solar_azimuth(t, 50) + 180) % 360 - 180 == (
+                pytest.approx(0, abs=1e-6)
+            )
+            assert elevation == pytest.approx(location.solar_elevation(t, 50), abs=1e-6)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from types import MappingProxyType, SimpleNamespace
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock
 
@@ -24,73 +26,146 @@ from custom_components.adaptive_cover.const import (
     DOMAIN,
     EntryType,
 )
-from custom_components.adaptive_cover.switch import AdaptiveCoverSwitch
+from custom_components.adaptive_cover.room_coordinator import RoomCoordinator
+from custom_components.adaptive_cover.switch import (
+    AdaptiveCoverSwitch,
+    async_setup_entry,
+)
 
 if TYPE_CHECKING:
     pass
 
+_SWITCH_KEYS: tuple[tuple[str, str], ...] = (
+    ("lux_toggle", "Lux"),
+    ("irradiance_toggle", "Irradiance"),
+    ("cloud_toggle", "Cloud Coverage"),
+    ("weather_toggle", "Weather"),
+)
+_TOGGLES = tuple(key for key, _ in _SWITCH_KEYS)
+
+
+class _RoomCoordinatorStub(RoomCoordinator):
+    """RoomCoordinator without Home Assistant setup.
+
+    Subclassing keeps the switch's isinstance() dispatch working while
+    skipping the spec introspection MagicMock(spec=RoomCoordinator) does.
+    """
+
+    def __init__(self) -> None:  # pylint: disable=super-init-not-called
+        """Initialize only the state the switch touches."""
+        self.logger = MagicMock()
+        self.last_update_success = True
+        self._control_mode = CONTROL_MODE_AUTO
+        self._control_mode_select = None
+        self.async_refresh = AsyncMock()
+        self.async_notify_children = AsyncMock()
+        for toggle in _TOGGLES:
+            setattr(self, toggle, None)
+
+
+def _reset_coordinator(coordinator: MagicMock | _RoomCoordinatorStub) -> None:
+    """Restore a shared coordinator to its initial state."""
+    coordinator.control_mode = CONTROL_MODE_AUTO
+    coordinator.state_change = False
+    coordinator.async_refresh.reset_mock()
+    coordinator.async_notify_children.reset_mock()
+    for toggle in _TOGGLES:
+        setattr(coordinator, toggle, None)
+
+
+# Control mode, toggles and the async mock calls are reset by _reset_coordinators
+@pytest.fixture(scope="module")
+def mock_cover_coordinator() -> MagicMock:
+    """Create mock AdaptiveDataUpdateCoordinator shared across the module."""
+    coordinator = MagicMock()
+    coordinator.logger = MagicMock()
+    coordinator.last_update_success = True
+    coordinator.async_refresh = AsyncMock()
+    coordinator.async_notify_children = AsyncMock()
+    return coordinator
+
+
+@pytest.fixture(scope="module")
+def mock_room_coordinator() -> _RoomCoordinatorStub:
+    """Create stub RoomCoordinator shared across the module."""
+    return _RoomCoordinatorStub()
+
+
+@pytest.fixture(autouse=True)
+def _reset_coordinators(
+    mock_cover_coordinator: MagicMock, mock_room_coordinator: _RoomCoordinatorStub
+) -> None:
+    """Undo mutations a previous test made to the shared coordinators."""
+    _reset_coordinator(mock_cover_coordinator)
+    _reset_coordinator(mock_room_coordinator)
+
+
+@pytest.fixture(autouse=True)
+def _silence_schedule_update(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep switches from scheduling state writes on the unregistered entity."""
+    monkeypatch.setattr(
+        AdaptiveCoverSwitch, "schedule_update_ha_state", MagicMock(), raising=False
+    )
+
+
+@pytest.fixture(scope="module")
+def make_switch():
+    """Return a factory building AdaptiveCoverSwitch with common defaults."""
+
+    def _make(
+        coordinator,
+        entry,
+        *,
+        name: str = "Lux",
+        key: str = "lux_toggle",
+        initial_state: bool = True,
+        is_room: bool = False,
+        room_id: str | None = None,
+    ) -> AdaptiveCoverSwitch:
+        return AdaptiveCoverSwitch(
+            config_entry=entry,
+            unique_id=entry.entry_id,
+            switch_name=name,
+            initial_state=initial_state,
+            key=key,
+            coordinator=coordinator,
+            is_room=is_room,
+            room_id=room_id,
+        )
+
+    return _make
+
+
+class _EntityCollector:
+    """Stand-in for AddEntitiesCallback that records what was added."""
+
+    def __init__(self) -> None:
+        self.entities: list[AdaptiveCoverSwitch] = []
+
+    def __call__(self, entities) -> None:
+        self.entities.extend(entities)
+
+
+@pytest.fixture
+def collector() -> _EntityCollector:
+    """Return a fresh add_entities callback for async_setup_entry."""
+    return _EntityCollector()
+
 
 class TestAdaptiveCoverSwitch:
     """Tests for AdaptiveCoverSwitch."""
 
-    @pytest.fixture
-    def mock_cover_coordinator(self) -> MagicMock:
-        """Create mock AdaptiveDataUpdateCoordinator."""
-        coordinator = MagicMock()
-        coordinator.logger = MagicMock()
-        coordinator.control_mode = CONTROL_MODE_AUTO
-        coordinator.async_refresh = AsyncMock()
-        coordinator.lux_toggle = None
-        coordinator.irradiance_toggle = None
-        coordinator.cloud_toggle = None
-        coordinator.weather_toggle = None
-        return coordinator
-
-    @pytest.fixture
-    def mock_room_coordinator(self) -> MagicMock:
-        """Create mock RoomCoordinator."""
-        from custom_components.adaptive_cover.room_coordinator import RoomCoordinator
-
-        coordinator = MagicMock(spec=RoomCoordinator)
-        coordinator.logger = MagicMock()
-        coordinator.control_mode = CONTROL_MODE_AUTO
-        coordinator.async_refresh = AsyncMock()
-        coordinator.async_notify_children = AsyncMock()
-        coordinator.lux_toggle = None
-        coordinator.irradiance_toggle = None
-        coordinator.cloud_toggle = None
-        coordinator.weather_toggle = None
-        return coordinator
-
-    @pytest.fixture
-    def mock_cover_config_entry(self) -> MagicMock:
-        """Create mock ConfigEntry for cover."""
-        entry = MagicMock()
-        entry.entry_id = "test_cover_entry"
-        entry.data = {"name": "Test Cover", CONF_ENTRY_TYPE: EntryType.COVER}
-        entry.options = {}
-        return entry
-
-    @pytest.fixture
-    def mock_room_config_entry(self) -> MagicMock:
-        """Create mock ConfigEntry for room."""
-        entry = MagicMock()
-        entry.entry_id = "test_room_entry"
-        entry.data = {"name": "Test Room", CONF_ENTRY_TYPE: EntryType.ROOM}
-        entry.options = {}
-        return entry
-
     def test_init_room(
-        self, mock_room_config_entry: MagicMock, mock_room_coordinator: MagicMock
+        self,
+        make_switch,
+        mock_room_config_entry: SimpleNamespace,
+        mock_room_coordinator: _RoomCoordinatorStub,
     ) -> None:
         """Test initialization for room entry."""
-        switch = AdaptiveCoverSwitch(
-            config_entry=mock_room_config_entry,
-            unique_id=mock_room_config_entry.entry_id,
-            switch_name="Lux",
+        switch = make_switch(
+            mock_room_coordinator,
+            mock_room_config_entry,
             initial_state=False,
-            key="lux_toggle",
-            coordinator=mock_room_coordinator,
             is_room=True,
         )
 
@@ -101,17 +176,13 @@ class TestAdaptiveCoverSwitch:
         assert "room_" in str(switch._attr_device_info["identifiers"])
 
     def test_init_standalone(
-        self, mock_cover_config_entry: MagicMock, mock_cover_coordinator: MagicMock
+        self,
+        make_switch,
+        mock_cover_config_entry: SimpleNamespace,
+        mock_cover_coordinator: MagicMock,
     ) -> None:
         """Test initialization for standalone cover."""
-        switch = AdaptiveCoverSwitch(
-            config_entry=mock_cover_config_entry,
-            unique_id=mock_cover_config_entry.entry_id,
-            switch_name="Lux",
-            initial_state=True,
-            key="lux_toggle",
-            coordinator=mock_cover_coordinator,
-        )
+        switch = make_switch(mock_cover_coordinator, mock_cover_config_entry)
 
         assert switch._name == "Test Cover"
         assert switch._attr_unique_id == "test_cover_entry_Lux"
@@ -119,16 +190,17 @@ class TestAdaptiveCoverSwitch:
         assert switch._initial_state is True
 
     def test_init_with_room_id(
-        self, mock_cover_config_entry: MagicMock, mock_cover_coordinator: MagicMock
+        self,
+        make_switch,
+        mock_cover_config_entry: SimpleNamespace,
+        mock_cover_coordinator: MagicMock,
     ) -> None:
         """Test initialization for cover with room_id."""
-        switch = AdaptiveCoverSwitch(
-            config_entry=mock_cover_config_entry,
-            unique_id=mock_cover_config_entry.entry_id,
-            switch_name="Weather",
-            initial_state=True,
+        switch = make_switch(
+            mock_cover_coordinator,
+            mock_cover_config_entry,
+            name="Weather",
             key="weather_toggle",
-            coordinator=mock_cover_coordinator,
             room_id="room_123",
         )
 
@@ -136,253 +208,108 @@ class TestAdaptiveCoverSwitch:
         assert switch._attr_name == "Test Cover Weather"
         assert switch._attr_has_entity_name is False
 
-    def test_available_auto_mode(
-        self, mock_cover_config_entry: MagicMock, mock_cover_coordinator: MagicMock
-    ) -> None:
-        """Test available is True in AUTO mode."""
-        mock_cover_coordinator.control_mode = CONTROL_MODE_AUTO
-
-        switch = AdaptiveCoverSwitch(
-            config_entry=mock_cover_config_entry,
-            unique_id=mock_cover_config_entry.entry_id,
-            switch_name="Lux",
-            initial_state=True,
-            key="lux_toggle",
-            coordinator=mock_cover_coordinator,
-        )
-
-        assert switch.available is True
-
-    def test_available_disabled_mode(
-        self, mock_cover_config_entry: MagicMock, mock_cover_coordinator: MagicMock
-    ) -> None:
-        """Test available is False in DISABLED mode."""
-        mock_cover_coordinator.control_mode = CONTROL_MODE_DISABLED
-
-        switch = AdaptiveCoverSwitch(
-            config_entry=mock_cover_config_entry,
-            unique_id=mock_cover_config_entry.entry_id,
-            switch_name="Lux",
-            initial_state=True,
-            key="lux_toggle",
-            coordinator=mock_cover_coordinator,
-        )
-
-        assert switch.available is False
-
-    def test_available_force_mode(
-        self, mock_cover_config_entry: MagicMock, mock_cover_coordinator: MagicMock
-    ) -> None:
-        """Test available is False in FORCE mode."""
-        mock_cover_coordinator.control_mode = CONTROL_MODE_FORCE
-
-        switch = AdaptiveCoverSwitch(
-            config_entry=mock_cover_config_entry,
-            unique_id=mock_cover_config_entry.entry_id,
-            switch_name="Lux",
-            initial_state=True,
-            key="lux_toggle",
-            coordinator=mock_cover_coordinator,
-        )
-
-        assert switch.available is False
-
-    @pytest.mark.asyncio
-    async def test_turn_on(
-        self, mock_cover_config_entry: MagicMock, mock_cover_coordinator: MagicMock
-    ) -> None:
-        """Test turn_on sets coordinator attribute."""
-        switch = AdaptiveCoverSwitch(
-            config_entry=mock_cover_config_entry,
-            unique_id=mock_cover_config_entry.entry_id,
-            switch_name="Lux",
-            initial_state=False,
-            key="lux_toggle",
-            coordinator=mock_cover_coordinator,
-        )
-
-        # Mock schedule_update_ha_state
-        switch.schedule_update_ha_state = MagicMock()
-
-        await switch.async_turn_on()
-
-        assert switch._attr_is_on is True
-        assert mock_cover_coordinator.lux_toggle is True
-        assert mock_cover_coordinator.state_change is True
-        mock_cover_coordinator.async_refresh.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_turn_on_with_added_flag(
-        self, mock_cover_config_entry: MagicMock, mock_cover_coordinator: MagicMock
-    ) -> None:
-        """Test turn_on with added flag skips refresh."""
-        switch = AdaptiveCoverSwitch(
-            config_entry=mock_cover_config_entry,
-            unique_id=mock_cover_config_entry.entry_id,
-            switch_name="Lux",
-            initial_state=False,
-            key="lux_toggle",
-            coordinator=mock_cover_coordinator,
-        )
-
-        # Mock schedule_update_ha_state
-        switch.schedule_update_ha_state = MagicMock()
-
-        await switch.async_turn_on(added=True)
-
-        assert switch._attr_is_on is True
-        assert mock_cover_coordinator.lux_toggle is True
-        # async_refresh should NOT be called when added=True
-        mock_cover_coordinator.async_refresh.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_turn_off(
-        self, mock_cover_config_entry: MagicMock, mock_cover_coordinator: MagicMock
-    ) -> None:
-        """Test turn_off sets coordinator attribute."""
-        switch = AdaptiveCoverSwitch(
-            config_entry=mock_cover_config_entry,
-            unique_id=mock_cover_config_entry.entry_id,
-            switch_name="Lux",
-            initial_state=True,
-            key="lux_toggle",
-            coordinator=mock_cover_coordinator,
-        )
-
-        # Mock schedule_update_ha_state
-        switch.schedule_update_ha_state = MagicMock()
-
-        await switch.async_turn_off()
-
-        assert switch._attr_is_on is False
-        assert mock_cover_coordinator.lux_toggle is False
-        assert mock_cover_coordinator.state_change is True
-        mock_cover_coordinator.async_refresh.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_turn_off_with_added_flag(
-        self, mock_cover_config_entry: MagicMock, mock_cover_coordinator: MagicMock
-    ) -> None:
-        """Test turn_off with added flag skips refresh."""
-        switch = AdaptiveCoverSwitch(
-            config_entry=mock_cover_config_entry,
-            unique_id=mock_cover_config_entry.entry_id,
-            switch_name="Lux",
-            initial_state=True,
-            key="lux_toggle",
-            coordinator=mock_cover_coordinator,
-        )
-
-        # Mock schedule_update_ha_state
-        switch.schedule_update_ha_state = MagicMock()
-
-        await switch.async_turn_off(added=True)
-
-        assert switch._attr_is_on is False
-        assert mock_cover_coordinator.lux_toggle is False
-        # async_refresh should NOT be called when added=True
-        mock_cover_coordinator.async_refresh.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_turn_on_room_notifies_children(
-        self, mock_room_config_entry: MagicMock, mock_room_coordinator: MagicMock
+    @pytest.mark.parametrize(
+        ("mode", "expected"),
+        [
+            (CONTROL_MODE_AUTO, True),
+            (CONTROL_MODE_DISABLED, False),
+            (CONTROL_MODE_FORCE, False),
+        ],
+    )
+    def test_available(
+        self,
+        make_switch,
+        mock_cover_config_entry: SimpleNamespace,
+        mock_cover_coordinator: MagicMock,
+        mode: str,
+        expected: bool,
     ) -> None:
-        """Test turn_on for room notifies children."""
-        switch = AdaptiveCoverSwitch(
-            config_entry=mock_room_config_entry,
-            unique_id=mock_room_config_entry.entry_id,
-            switch_name="Weather",
-            initial_state=False,
-            key="weather_toggle",
-            coordinator=mock_room_coordinator,
-            is_room=True,
-        )
+        """Test available is True only in AUTO mode."""
+        mock_cover_coordinator.control_mode = mode
 
-        # Mock schedule_update_ha_state
-        switch.schedule_update_ha_state = MagicMock()
+        switch = make_switch(mock_cover_coordinator, mock_cover_config_entry)
 
-        await switch.async_turn_on()
+        assert switch.available is expected
 
-        assert switch._attr_is_on is True
-        assert mock_room_coordinator.weather_toggle is True
-        mock_room_coordinator.async_refresh.assert_called_once()
-        mock_room_coordinator.async_notify_children.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_turn_off_room_notifies_children(
-        self, mock_room_config_entry: MagicMock, mock_room_coordinator: MagicMock
+    @pytest.mark.parametrize("is_room", [False, True], ids=["standalone", "room"])
+    @pytest.mark.parametrize("added", [False, True], ids=["user", "restore"])
+    @pytest.mark.parametrize("turn_on", [True, False], ids=["on", "off"])
+    async def test_turn_on_off(
+        self,
+        make_switch,
+        mock_cover_config_entry: SimpleNamespace,
+        mock_cover_coordinator: MagicMock,
+        mock_room_config_entry: SimpleNamespace,
+        mock_room_coordinator: _RoomCoordinatorStub,
+        turn_on: bool,
+        added: bool,
+        is_room: bool,
     ) -> None:
-        """Test turn_off for room notifies children."""
-        switch = AdaptiveCoverSwitch(
-            config_entry=mock_room_config_entry,
-            unique_id=mock_room_config_entry.entry_id,
-            switch_name="Cloud Coverage",
-            initial_state=True,
-            key="cloud_toggle",
-            coordinator=mock_room_coordinator,
-            is_room=True,
+        """Test turning on/off sets the toggle and refreshes unless restoring."""
+        coordinator, entry = (
+            (mock_room_coordinator, mock_room_config_entry)
+            if is_room
+            else (mock_cover_coordinator, mock_cover_config_entry)
         )
-
-        # Mock schedule_update_ha_state
-        switch.schedule_update_ha_state = MagicMock()
-
-        await switch.async_turn_off()
-
-        assert switch._attr_is_on is False
-        assert mock_room_coordinator.cloud_toggle is False
-        mock_room_coordinator.async_refresh.assert_called_once()
-        mock_room_coordinator.async_notify_children.assert_called_once()
-
-    def test_device_info_room(
-        self, mock_room_config_entry: MagicMock, mock_room_coordinator: MagicMock
-    ) -> None:
-        """Test device info for room switch."""
-        switch = AdaptiveCoverSwitch(
-            config_entry=mock_room_config_entry,
-            unique_id=mock_room_config_entry.entry_id,
-            switch_name="Lux",
-            initial_state=True,
-            key="lux_toggle",
-            coordinator=mock_room_coordinator,
-            is_room=True,
+        switch = make_switch(
+            coordinator, entry, initial_state=not turn_on, is_room=is_room
         )
 
-        device_info = switch._attr_device_info
-        identifiers = list(device_info["identifiers"])[0]
-        assert identifiers[0] == DOMAIN
-        assert identifiers[1] == "room_test_room_entry"
-        assert device_info["name"] == "Room: Test Room"
-
-    def test_device_info_standalone(
-        self, mock_cover_config_entry: MagicMock, mock_cover_coordinator: MagicMock
+        action = switch.async_turn_on if turn_on else switch.async_turn_off
+        await action(added=added)
+
+        assert switch._attr_is_on is turn_on
+        assert coordinator.lux_toggle is turn_on
+        # Restoring state (added=True) must not refresh or notify children
+        assert coordinator.async_refresh.await_count == int(not added)
+        if is_room:
+            assert coordinator.async_notify_children.await_count == int(not added)
+        elif not added:
+            assert coordinator.state_change is True
+
+    @pytest.mark.parametrize(
+        ("is_room", "expected_id", "expected_name"),
+        [
+            (True, "room_test_room_entry", "Room: Test Room"),
+            (False, "test_cover_entry", "Test Cover"),
+        ],
+        ids=["room", "standalone"],
+    )
+    def test_device_info(
+        self,
+        make_switch,
+        mock_cover_config_entry: SimpleNamespace,
+        mock_cover_coordinator: MagicMock,
+        mock_room_config_entry: SimpleNamespace,
+        mock_room_coordinator: _RoomCoordinatorStub,
+        is_room: bool,
+        expected_id: str,
+        expected_name: str,
     ) -> None:
-        """Test device info for standalone switch."""
-        switch = AdaptiveCoverSwitch(
-            config_entry=mock_cover_config_entry,
-            unique_id=mock_cover_config_entry.entry_id,
-            switch_name="Lux",
-            initial_state=True,
-            key="lux_toggle",
-            coordinator=mock_cover_coordinator,
+        """Test device info for room and standalone switches."""
+        coordinator, entry = (
+            (mock_room_coordinator, mock_room_config_entry)
+            if is_room
+            else (mock_cover_coordinator, mock_cover_config_entry)
         )
+        switch = make_switch(coordinator, entry, is_room=is_room)
 
         device_info = switch._attr_device_info
-        identifiers = list(device_info["identifiers"])[0]
-        assert identifiers[0] == DOMAIN
-        assert identifiers[1] == "test_cover_entry"
-        assert device_info["name"] == "Test Cover"
+        assert next(iter(device_info["identifiers"])) == (DOMAIN, expected_id)
+        assert device_info["name"] == expected_name
 
     def test_device_info_with_via_device(
-        self, mock_cover_config_entry: MagicMock, mock_cover_coordinator: MagicMock
+        self,
+        make_switch,
+        mock_cover_config_entry: SimpleNamespace,
+        mock_cover_coordinator: MagicMock,
     ) -> None:
         """Test device info with via_device for cover in room."""
-        switch = AdaptiveCoverSwitch(
-            config_entry=mock_cover_config_entry,
-            unique_id=mock_cover_config_entry.entry_id,
-            switch_name="Weather",
-            initial_state=True,
+        switch = make_switch(
+            mock_cover_coordinator,
+            mock_cover_config_entry,
+            name="Weather",
             key="weather_toggle",
-            coordinator=mock_cover_coordinator,
             room_id="room_123",
         )
 
@@ -390,259 +317,151 @@ class TestAdaptiveCoverSwitch:
         assert "via_device" in device_info
         assert device_info["via_device"] == (DOMAIN, "room_room_123")
 
+    @pytest.mark.parametrize(("key", "name"), _SWITCH_KEYS)
     def test_different_switch_keys(
-        self, mock_cover_config_entry: MagicMock, mock_cover_coordinator: MagicMock
+        self,
+        make_switch,
+        mock_cover_config_entry: SimpleNamespace,
+        mock_cover_coordinator: MagicMock,
+        key: str,
+        name: str,
     ) -> None:
         """Test different switch keys are handled correctly."""
-        keys = [
-            ("lux_toggle", "Lux"),
-            ("irradiance_toggle", "Irradiance"),
-            ("cloud_toggle", "Cloud Coverage"),
-            ("weather_toggle", "Weather"),
-        ]
-
-        for key, name in keys:
-            switch = AdaptiveCoverSwitch(
-                config_entry=mock_cover_config_entry,
-                unique_id=mock_cover_config_entry.entry_id,
-                switch_name=name,
-                initial_state=True,
-                key=key,
-                coordinator=mock_cover_coordinator,
-            )
+        switch = make_switch(
+            mock_cover_coordinator, mock_cover_config_entry, name=name, key=key
+        )
 
-            assert switch._key == key
-            assert switch._attr_translation_key == key
+        assert switch._key == key
+        assert switch._attr_translation_key == key
 
 
 class TestSwitchAsyncSetupEntry:
     """Tests for switch async_setup_entry function."""
 
-    @pytest.fixture
-    def mock_room_coordinator(self) -> MagicMock:
-        """Create mock RoomCoordinator."""
-        from custom_components.adaptive_cover.room_coordinator import RoomCoordinator
-
-        coordinator = MagicMock(spec=RoomCoordinator)
-        coordinator.logger = MagicMock()
-        coordinator.control_mode = CONTROL_MODE_AUTO
-        coordinator.async_refresh = AsyncMock()
-        coordinator.async_notify_children = AsyncMock()
-        coordinator.lux_toggle = None
-        coordinator.irradiance_toggle = None
-        coordinator.cloud_toggle = None
-        coordinator.weather_toggle = None
-        coordinator.last_update_success = True
-        return coordinator
-
-    @pytest.fixture
-    def mock_cover_coordinator(self) -> MagicMock:
-        """Create mock AdaptiveDataUpdateCoordinator."""
-        coordinator = MagicMock()
-        coordinator.logger = MagicMock()
-        coordinator.control_mode = CONTROL_MODE_AUTO
-        coordinator.async_refresh = AsyncMock()
-        coordinator.lux_toggle = None
-        coordinator.irradiance_toggle = None
-        coordinator.cloud_toggle = None
-        coordinator.weather_toggle = None
-        coordinator.last_update_success = True
-        return coordinator
-
-    @pytest.fixture
-    def mock_room_config_entry(self) -> MagicMock:
+    @pytest.fixture(scope="class")
+    def mock_room_config_entry(self) -> SimpleNamespace:
         """Create mock ConfigEntry for room with all sensor entities."""
-        entry = MagicMock()
-        entry.entry_id = "test_room_entry"
-        entry.data = {"name": "Test Room", CONF_ENTRY_TYPE: EntryType.ROOM}
-        # Room entries always have climate_mode=True automatically
-        # Need to provide entities for each switch to be created
-        entry.options = {
-            CONF_LUX_ENTITY: "sensor.lux",  # lux_switch
-            CONF_IRRADIANCE_ENTITY: "sensor.irradiance",  # irradiance_switch
-            CONF_CLOUD_ENTITY: "sensor.cloud",  # cloud_switch
-            CONF_WEATHER_ENTITY: "weather.home",  # weather_switch
-        }
-        return entry
+        return SimpleNamespace(
+            entry_id="test_room_entry",
+            data=MappingProxyType(
+                {"name": "Test Room", CONF_ENTRY_TYPE: EntryType.ROOM}
+            ),
+            # Room entries always have climate_mode=True automatically
+            # Need to provide entities for each switch to be created
+            options=MappingProxyType(
+                {
+                    CONF_LUX_ENTITY: "sensor.lux",  # lux_switch
+                    CONF_IRRADIANCE_ENTITY: "sensor.irradiance",  # irradiance_switch
+                    CONF_CLOUD_ENTITY: "sensor.cloud",  # cloud_switch
+                    CONF_WEATHER_ENTITY: "weather.home",  # weather_switch
+                }
+            ),
+        )
 
-    @pytest.fixture
-    def mock_cover_config_entry(self) -> MagicMock:
+    @pytest.fixture(scope="class")
+    def mock_cover_config_entry(self) -> SimpleNamespace:
         """Create mock ConfigEntry for standalone cover with climate mode."""
-        entry = MagicMock()
-        entry.entry_id = "test_cover_entry"
-        entry.data = {"name": "Test Cover", CONF_ENTRY_TYPE: EntryType.COVER}
-        # Standalone covers need climate_mode enabled and entities configured
-        entry.options = {
-            CONF_ENTITIES: ["cover.living_room"],
-            CONF_CLIMATE_MODE: True,
-            CONF_LUX_ENTITY: "sensor.lux",
-            CONF_IRRADIANCE_ENTITY: "sensor.irradiance",
-            CONF_CLOUD_ENTITY: "sensor.cloud",
-            CONF_WEATHER_ENTITY: "weather.home",
-        }
-        return entry
+        return SimpleNamespace(
+            entry_id="test_cover_entry",
+            data=MappingProxyType(
+                {"name": "Test Cover", CONF_ENTRY_TYPE: EntryType.COVER}
+            ),
+            # Standalone covers need climate_mode enabled and entities configured
+            options=MappingProxyType(
+                {
+                    CONF_ENTITIES: ["cover.living_room"],
+                    CONF_CLIMATE_MODE: True,
+                    CONF_LUX_ENTITY: "sensor.lux",
+                    CONF_IRRADIANCE_ENTITY: "sensor.irradiance",
+                    CONF_CLOUD_ENTITY: "sensor.cloud",
+                    CONF_WEATHER_ENTITY: "weather.home",
+                }
+            ),
+        )
 
-    @pytest.fixture
-    def mock_cover_in_room_config_entry(self) -> MagicMock:
+    @pytest.fixture(scope="class")
+    def mock_cover_in_room_config_entry(self) -> SimpleNamespace:
         """Create mock ConfigEntry for cover in room."""
-        entry = MagicMock()
-        entry.entry_id = "test_cover_room_entry"
-        entry.data = {
-            "name": "Test Cover in Room",
-            CONF_ENTRY_TYPE: EntryType.COVER,
-            CONF_ROOM_ID: "room_123",
-        }
-        entry.options = {CONF_ENTITIES: ["cover.living_room"]}
-        return entry
+        return SimpleNamespace(
+            entry_id="test_cover_room_entry",
+            data=MappingProxyType(
+                {
+                    "name": "Test Cover in Room",
+                    CONF_ENTRY_TYPE: EntryType.COVER,
+                    CONF_ROOM_ID: "room_123",
+                }
+            ),
+            options=MappingProxyType({CONF_ENTITIES: ["cover.living_room"]}),
+        )
 
-    @pytest.mark.asyncio
-    async def test_setup_room_entry_creates_switches(
+    @pytest.mark.parametrize(
+        ("entry_fixture", "coordinator_fixture", "is_room"),
+        [
+            ("mock_room_config_entry", "mock_room_coordinator", True),
+            ("mock_cover_config_entry", "mock_cover_coordinator", False),
+        ],
+        ids=["room", "standalone"],
+    )
+    async def test_setup_creates_switches(
         self,
         hass,
-        mock_room_config_entry: MagicMock,
-        mock_room_coordinator: MagicMock,
+        request: pytest.FixtureRequest,
+        entry_fixture: str,
+        coordinator_fixture: str,
+        is_room: bool,
+        collector: _EntityCollector,
     ) -> None:
-        """Test async_setup_entry creates all 5 toggle switches for room."""
-        from custom_components.adaptive_cover.switch import async_setup_entry
-
-        hass.data[DOMAIN] = {mock_room_config_entry.entry_id: mock_room_coordinator}
-
-        entities_added = []
+        """Test async_setup_entry creates all toggle switches for rooms and standalone covers."""
+        entry = request.getfixturevalue(entry_fixture)
+        coordinator = request.getfixturevalue(coordinator_fixture)
+        hass.data[DOMAIN] = {entry.entry_id: coordinator}
 
-        def add_entities(entities):
-            entities_added.extend(entities)
-
-        await async_setup_entry(hass, mock_room_config_entry, add_entities)
-
-        # Should create 4 switches: lux, irradiance, cloud, weather
-        assert len(entities_added) == 4
-        keys = {e._key for e in entities_added}
-        assert keys == {
-            "lux_toggle",
-            "irradiance_toggle",
-            "cloud_toggle",
-            "weather_toggle",
-        }
-        # All should be marked as room
-        assert all(e._is_room is True for e in entities_added)
-
-    @pytest.mark.asyncio
-    async def test_setup_standalone_cover_creates_switches(
-        self,
-        hass,
-        mock_cover_config_entry: MagicMock,
-        mock_cover_coordinator: MagicMock,
-    ) -> None:
-        """Test async_setup_entry creates all 5 toggle switches for standalone cover."""
-        from custom_components.adaptive_cover.switch import async_setup_entry
+        await async_setup_entry(hass, entry, collector)
 
-        hass.data[DOMAIN] = {mock_cover_config_entry.entry_id: mock_cover_coordinator}
+        entities = collector.entities
+        # One switch per toggle: lux, irradiance, cloud, weather
+        assert len(entities) == len(_TOGGLES)
+        assert {e._key for e in entities} == set(_TOGGLES)
+        assert all(e._is_room is is_room for e in entities)
 
-        entities_added = []
-
-        def add_entities(entities):
-            entities_added.extend(entities)
-
-        await async_setup_entry(hass, mock_cover_config_entry, add_entities)
-
-        # Should create 4 switches
-        assert len(entities_added) == 4
-        keys = {e._key for e in entities_added}
-        assert keys == {
-            "lux_toggle",
-            "irradiance_toggle",
-            "cloud_toggle",
-            "weather_toggle",
-        }
-        # All should NOT be marked as room
-        assert all(e._is_room is False for e in entities_added)
-
-    @pytest.mark.asyncio
     async def test_setup_cover_in_room_no_switches(
         self,
         hass,
-        mock_cover_in_room_config_entry: MagicMock,
+        mock_cover_in_room_config_entry: SimpleNamespace,
         mock_cover_coordinator: MagicMock,
+        collector: _EntityCollector,
     ) -> None:
         """Test async_setup_entry creates no switches for cover in room (room handles it)."""
-        from custom_components.adaptive_cover.switch import async_setup_entry
-
         hass.data[DOMAIN] = {
             mock_cover_in_room_config_entry.entry_id: mock_cover_coordinator
         }
 
-        entities_added = []
+        await async_setup_entry(hass, mock_cover_in_room_config_entry, collector)
 
-        def add_entities(entities):
-            entities_added.extend(entities)
-
-        await async_setup_entry(hass, mock_cover_in_room_config_entry, add_entities)
-
-        assert len(entities_added) == 0
+        assert collector.entities == []
 
 
 class TestAdaptiveCoverSwitchCoordinatorUpdates:
     """Tests for AdaptiveCoverSwitch coordinator update handling."""
 
-    @pytest.fixture
-    def mock_cover_coordinator(self) -> MagicMock:
-        """Create mock AdaptiveDataUpdateCoordinator."""
-        coordinator = MagicMock()
-        coordinator.logger = MagicMock()
-        coordinator.control_mode = CONTROL_MODE_AUTO
-        coordinator.async_refresh = AsyncMock()
-        coordinator.lux_toggle = None
-        coordinator.irradiance_toggle = None
-        coordinator.cloud_toggle = None
-        coordinator.weather_toggle = None
-        return coordinator
-
-    @pytest.fixture
-    def mock_room_coordinator(self) -> MagicMock:
-        """Create mock RoomCoordinator."""
-        from custom_components.adaptive_cover.room_coordinator import RoomCoordinator
-
-        coordinator = MagicMock(spec=RoomCoordinator)
-        coordinator.logger = MagicMock()
-        coordinator.control_mode = CONTROL_MODE_AUTO
-        coordinator.async_refresh = AsyncMock()
-        coordinator.async_notify_children = AsyncMock()
-        coordinator.lux_toggle = None
-        coordinator.irradiance_toggle = None
-        coordinator.cloud_toggle = None
-        coordinator.weather_toggle = None
-        return coordinator
-
-    @pytest.fixture
-    def mock_cover_config_entry(self) -> MagicMock:
-        """Create mock ConfigEntry for cover."""
-        entry = MagicMock()
-        entry.entry_id = "test_cover_entry"
-        entry.data = {"name": "Test Cover", CONF_ENTRY_TYPE: EntryType.COVER}
-        entry.options = {}
-        return entry
-
-    @pytest.fixture
-    def mock_room_config_entry(self) -> MagicMock:
-        """Create mock ConfigEntry for room."""
-        entry = MagicMock()
-        entry.entry_id = "test_room_entry"
-        entry.data = {"name": "Test Room", CONF_ENTRY_TYPE: EntryType.ROOM}
-        entry.options = {}
-        return entry
+    @pytest.fixture(autouse=True, scope="class")
+    def _patch_coordinator_entity_added(self) -> Iterator[None]:
+        """Stub CoordinatorEntity.async_added_to_hass to avoid a full hass setup."""
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(
+                "custom_components.adaptive_cover.switch.CoordinatorEntity.async_added_to_hass",
+                AsyncMock(),
+            )
+            yield
 
     def test_handle_coordinator_update_calls_async_write_ha_state(
-        self, mock_cover_config_entry: MagicMock, mock_cover_coordinator: MagicMock
+        self,
+        make_switch,
+        mock_cover_config_entry: SimpleNamespace,
+        mock_cover_coordinator: MagicMock,
     ) -> None:
         """Test _handle_coordinator_update calls async_write_ha_state."""
-        switch = AdaptiveCoverSwitch(
-            config_entry=mock_cover_config_entry,
-            unique_id=mock_cover_config_entry.entry_id,
-            switch_name="Lux",
-            initial_state=True,
-            key="lux_toggle",
-            coordinator=mock_cover_coordinator,
-        )
+        switch = make_switch(mock_cover_coordinator, mock_cover_config_entry)
         switch.async_write_ha_state = MagicMock()
 
         switch._handle_coordinator_update()
@@ -650,18 +469,14 @@ class TestAdaptiveCoverSwitchCoordinatorUpdates:
         switch.async_write_ha_state.assert_called_once()
 
     def test_availability_changes_with_control_mode(
-        self, mock_cover_config_entry: MagicMock, mock_cover_coordinator: MagicMock
+        self,
+        make_switch,
+        mock_cover_config_entry: SimpleNamespace,
+        mock_cover_coordinator: MagicMock,
     ) -> None:
         """Test availability changes when coordinator control_mode changes."""
         mock_cover_coordinator.control_mode = CONTROL_MODE_AUTO
-        switch = AdaptiveCoverSwitch(
-            config_entry=mock_cover_config_entry,
-            unique_id=mock_cover_config_entry.entry_id,
-            switch_name="Lux",
-            initial_state=True,
-            key="lux_toggle",
-            coordinator=mock_cover_coordinator,
-        )
+        switch = make_switch(mock_cover_coordinator, mock_cover_config_entry)
 
         # Initially available in AUTO mode
         assert switch.available is True
@@ -674,121 +489,57 @@ class TestAdaptiveCoverSwitchCoordinatorUpdates:
         mock_cover_coordinator.control_mode = CONTROL_MODE_AUTO
         assert switch.available is True
 
-    @pytest.mark.asyncio
-    async def test_async_added_to_hass_restores_on_state(
-        self, mock_cover_config_entry: MagicMock, mock_cover_coordinator: MagicMock
-    ) -> None:
-        """Test async_added_to_hass restores ON state."""
-        switch = AdaptiveCoverSwitch(
-            config_entry=mock_cover_config_entry,
-            unique_id=mock_cover_config_entry.entry_id,
-            switch_name="Lux",
-            initial_state=False,
-            key="lux_toggle",
-            coordinator=mock_cover_coordinator,
-        )
-        switch.schedule_update_ha_state = MagicMock()
-
-        mock_state = MagicMock()
-        mock_state.state = STATE_ON
-        switch.async_get_last_state = AsyncMock(return_value=mock_state)
-
-        # Mock super().async_added_to_hass() to avoid needing full hass setup
-        with pytest.MonkeyPatch.context() as mp:
-            mp.setattr(
-                "custom_components.adaptive_cover.switch.CoordinatorEntity.async_added_to_hass",
-                AsyncMock(),
-            )
-            await switch.async_added_to_hass()
-
-        assert switch._attr_is_on is True
-        assert mock_cover_coordinator.lux_toggle is True
-
-    @pytest.mark.asyncio
-    async def test_async_added_to_hass_restores_off_state(
-        self, mock_cover_config_entry: MagicMock, mock_cover_coordinator: MagicMock
+    @pytest.mark.parametrize(
+        ("last", "initial", "expected"),
+        [
+            (STATE_ON, False, True),
+            (STATE_OFF, True, False),
+            (None, True, True),
+        ],
+        ids=["restores_on", "restores_off", "no_last_state"],
+    )
+    async def test_async_added_to_hass(
+        self,
+        make_switch,
+        mock_cover_config_entry: SimpleNamespace,
+        mock_cover_coordinator: MagicMock,
+        last: str | None,
+        initial: bool,
+        expected: bool,
     ) -> None:
-        """Test async_added_to_hass restores OFF state."""
-        switch = AdaptiveCoverSwitch(
-            config_entry=mock_cover_config_entry,
-            unique_id=mock_cover_config_entry.entry_id,
-            switch_name="Lux",
-            initial_state=True,
-            key="lux_toggle",
-            coordinator=mock_cover_coordinator,
+        """Test async_added_to_hass restores last state, else uses initial_state."""
+        switch = make_switch(
+            mock_cover_coordinator, mock_cover_config_entry, initial_state=initial
         )
-        switch.schedule_update_ha_state = MagicMock()
-
-        mock_state = MagicMock()
-        mock_state.state = STATE_OFF
-        switch.async_get_last_state = AsyncMock(return_value=mock_state)
-
-        # Mock super().async_added_to_hass() to avoid needing full hass setup
-        with pytest.MonkeyPatch.context() as mp:
-            mp.setattr(
-                "custom_components.adaptive_cover.switch.CoordinatorEntity.async_added_to_hass",
-                AsyncMock(),
-            )
-            await switch.async_added_to_hass()
-
-        assert switch._attr_is_on is False
-        assert mock_cover_coordinator.lux_toggle is False
-
-    @pytest.mark.asyncio
-    async def test_async_added_to_hass_uses_initial_state_when_no_last_state(
-        self, mock_cover_config_entry: MagicMock, mock_cover_coordinator: MagicMock
-    ) -> None:
-        """Test async_added_to_hass uses initial_state when no last state."""
-        switch = AdaptiveCoverSwitch(
-            config_entry=mock_cover_config_entry,
-            unique_id=mock_cover_config_entry.entry_id,
-            switch_name="Lux",
-            initial_state=True,
-            key="lux_toggle",
-            coordinator=mock_cover_coordinator,
+        switch.async_get_last_state = AsyncMock(
+            return_value=MagicMock(state=last) if last else None
         )
-        switch.schedule_update_ha_state = MagicMock()
-        switch.async_get_last_state = AsyncMock(return_value=None)
 
-        # Mock super().async_added_to_hass() to avoid needing full hass setup
-        with pytest.MonkeyPatch.context() as mp:
-            mp.setattr(
-                "custom_components.adaptive_cover.switch.CoordinatorEntity.async_added_to_hass",
-                AsyncMock(),
-            )
-            await switch.async_added_to_hass()
+        await switch.async_added_to_hass()
 
-        # Should use initial_state=True
-        assert switch._attr_is_on is True
-        assert mock_cover_coordinator.lux_toggle is True
+        assert switch._attr_is_on is expected
+        assert mock_cover_coordinator.lux_toggle is expected
 
-    @pytest.mark.asyncio
     async def test_async_added_to_hass_room_coordinator_restores_state(
-        self, mock_room_config_entry: MagicMock, mock_room_coordinator: MagicMock
+        self,
+        make_switch,
+        mock_room_config_entry: SimpleNamespace,
+        mock_room_coordinator: _RoomCoordinatorStub,
     ) -> None:
         """Test async_added_to_hass restores state for room coordinator."""
-        switch = AdaptiveCoverSwitch(
-            config_entry=mock_room_config_entry,
-            unique_id=mock_room_config_entry.entry_id,
-            switch_name="Cloud Coverage",
-            initial_state=False,
+        switch = make_switch(
+            mock_room_coordinator,
+            mock_room_config_entry,
+            name="Cloud Coverage",
             key="cloud_toggle",
-            coordinator=mock_room_coordinator,
+            initial_state=False,
             is_room=True,
         )
-        switch.schedule_update_ha_state = MagicMock()
-
         mock_state = MagicMock()
         mock_state.state = STATE_ON
         switch.async_get_last_state = AsyncMock(return_value=mock_state)
 
-        # Mock super().async_added_to_hass() to avoid needing full hass setup
-        with pytest.MonkeyPatch.context() as mp:
-            mp.setattr(
-                "custom_components.adaptive_cover.switch.CoordinatorEntity.async_added_to_hass",
-                AsyncMock(),
-            )
-            await switch.async_added_to_hass()
+        await switch.async_added_to_hass()
 
         assert switch._attr_is_on is True
         assert mock_room_coordinator.cloud_toggle is True
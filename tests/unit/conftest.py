@@ -0,0 +1,19 @@
+"""Shared fixtures for Adaptive Cover unit tests."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def shared_hass() -> MagicMock:
+    """Create one mock Home Assistant instance shared by a test module.
+
+    Unlike mock_hass it is not rebuilt per test, so tests must not configure
+    it or assert on its calls; use mock_hass or monkeypatch for that.
+    """
+    hass = MagicMock()
+    hass.states.get.return_value = None
+    return hass
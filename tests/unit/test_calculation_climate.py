@@ -0,0 +1,534 @@
+"""Tests for ClimateCoverData sensor and override handling."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+
+class TestClimateCoverData:
+    """Tests for ClimateCoverData class."""
+
+    def test_is_presence_override_true(self, mock_hass: MagicMock, mock_logger) -> None:
+        """Test is_presence uses override value when set to True."""
+        from custom_components.adaptive_cover.calculation import ClimateCoverData
+
+        climate = ClimateCoverData(
+            hass=mock_hass,
+            logger=mock_logger,
+            temp_entity=None,
+            temp_low=20.0,
+            temp_high=25.0,
+            presence_entity="binary_sensor.motion",
+            weather_entity=None,
+            weather_condition=[],
+            blind_type="cover_blind",
+            transparent_blind=False,
+            lux_entity=None,
+            irradiance_entity=None,
+            lux_threshold=None,
+            irradiance_threshold=None,
+            _use_lux=False,
+            _use_irradiance=False,
+            cloud_entity=None,
+            cloud_threshold=None,
+            _use_cloud=False,
+            _is_presence_override=(True, True),  # Override to True
+        )
+
+        assert climate.is_presence is True
+
+    def test_is_presence_override_false(
+        self, mock_hass: MagicMock, mock_logger
+    ) -> None:
+        """Test is_presence uses override value when set to False."""
+        from custom_components.adaptive_cover.calculation import ClimateCoverData
+
+        climate = ClimateCoverData(
+            hass=mock_hass,
+            logger=mock_logger,
+            temp_entity=None,
+            temp_low=20.0,
+            temp_high=25.0,
+            presence_entity="binary_sensor.motion",
+            weather_entity=None,
+            weather_condition=[],
+            blind_type="cover_blind",
+            transparent_blind=False,
+            lux_entity=None,
+            irradiance_entity=None,
+            lux_threshold=None,
+            irradiance_threshold=None,
+            _use_lux=False,
+            _use_irradiance=False,
+            cloud_entity=None,
+            cloud_threshold=None,
+            _use_cloud=False,
+            _is_presence_override=(True, False),  # Override to False
+        )
+
+        assert climate.is_presence is False
+
+    def test_is_presence_no_entity(self, mock_hass: MagicMock, mock_logger) -> None:
+        """Test is_presence returns True when no entity configured."""
+        from custom_components.adaptive_cover.calculation import ClimateCoverData
+
+        climate = ClimateCoverData(
+            hass=mock_hass,
+            logger=mock_logger,
+            temp_entity=None,
+            temp_low=20.0,
+            temp_high=25.0,
+            presence_entity=None,  # No entity
+            weather_entity=None,
+            weather_condition=[],
+            blind_type="cover_blind",
+            transparent_blind=False,
+            lux_entity=None,
+            irradiance_entity=None,
+            lux_threshold=None,
+            irradiance_threshold=None,
+            _use_lux=False,
+            _use_irradiance=False,
+            cloud_entity=None,
+            cloud_threshold=None,
+            _use_cloud=False,
+        )
+
+        assert climate.is_presence is True
+
+    def test_has_direct_sun_override_true(
+        self, mock_hass: MagicMock, mock_logger
+    ) -> None:
+        """Test has_direct_sun uses override value when set to True."""
+        from custom_components.adaptive_cover.calculation import ClimateCoverData
+
+        climate = ClimateCoverData(
+            hass=mock_hass,
+            logger=mock_logger,
+            temp_entity=None,
+            temp_low=20.0,
+            temp_high=25.0,
+            presence_entity=None,
+            weather_entity="weather.home",
+            weather_condition=["sunny"],
+            blind_type="cover_blind",
+            transparent_blind=False,
+            lux_entity=None,
+            irradiance_entity=None,
+            lux_threshold=None,
+            irradiance_threshold=None,
+            _use_lux=False,
+            _use_irradiance=False,
+            cloud_entity=None,
+            cloud_threshold=None,
+            _use_cloud=False,
+            _has_direct_sun_override=(True, True),  # Override to True
+        )
+
+        assert climate.has_direct_sun is True
+
+    def test_has_direct_sun_override_false(
+        self, mock_hass: MagicMock, mock_logger
+    ) -> None:
+        """Test has_direct_sun uses override value when set to False."""
+        from custom_components.adaptive_cover.calculation import ClimateCoverData
+
+        climate = ClimateCoverData(
+            hass=mock_hass,
+            logger=mock_logger,
+            temp_entity=None,
+            temp_low=20.0,
+            temp_high=25.0,
+            presence_entity=None,
+            weather_entity="weather.home",
+            weather_condition=["sunny"],
+            blind_type="cover_blind",
+            transparent_blind=False,
+            lux_entity=None,
+            irradiance_entity=None,
+            lux_threshold=None,
+            irradiance_threshold=None,
+            _use_lux=False,
+            _use_irradiance=False,
+            cloud_entity=None,
+            cloud_threshold=None,
+            _use_cloud=False,
+            _has_direct_sun_override=(True, False),  # Override to False
+        )
+
+        assert climate.has_direct_sun is False
+
+    def test_has_direct_sun_no_entity(self, mock_hass: MagicMock, mock_logger) -> None:
+        """Test has_direct_sun returns True when no entity configured."""
+        from custom_components.adaptive_cover.calculation import ClimateCoverData
+
+        climate = ClimateCoverData(
+            hass=mock_hass,
+            logger=mock_logger,
+            temp_entity=None,
+            temp_low=20.0,
+            temp_high=25.0,
+            presence_entity=None,
+            weather_entity=None,  # No entity
+            weather_condition=[],
+            blind_type="cover_blind",
+            transparent_blind=False,
+            lux_entity=None,
+            irradiance_entity=None,
+            lux_threshold=None,
+            irradiance_threshold=None,
+            _use_lux=False,
+            _use_irradiance=False,
+            cloud_entity=None,
+            cloud_threshold=None,
+            _use_cloud=False,
+        )
+
+        assert climate.has_direct_sun is True
+
+    def test_lux_override(self, mock_hass: MagicMock, mock_logger) -> None:
+        """Test lux uses override value when set."""
+        from custom_components.adaptive_cover.calculation import ClimateCoverData
+
+        climate = ClimateCoverData(
+            hass=mock_hass,
+            logger=mock_logger,
+            temp_entity=None,
+            temp_low=20.0,
+            temp_high=25.0,
+            presence_entity=None,
+            weather_entity=None,
+            weather_condition=[],
+            blind_type="cover_blind",
+            transparent_blind=False,
+            lux_entity="sensor.lux",
+            irradiance_entity=None,
+            lux_threshold=1000,
+            irradiance_threshold=None,
+            _use_lux=True,
+            _use_irradiance=False,
+            cloud_entity=None,
+            cloud_threshold=None,
+            _use_cloud=False,
+            _lux_override=True,  # Override to True
+        )
+
+        assert climate.lux is True
+
+    def test_irradiance_override(self, mock_hass: MagicMock, mock_logger) -> None:
+        """Test irradiance uses override value when set."""
+        from custom_components.adaptive_cover.calculation import ClimateCoverData
+
+        climate = ClimateCoverData(
+            hass=mock_hass,
+            logger=mock_logger,
+            temp_entity=None,
+            temp_low=20.0,
+            temp_high=25.0,
+            presence_entity=None,
+            weather_entity=None,
+            weather_condition=[],
+            blind_type="cover_blind",
+            transparent_blind=False,
+            lux_entity=None,
+            irradiance_entity="sensor.irradiance",
+            lux_threshold=None,
+            irradiance_threshold=500,
+            _use_lux=False,
+            _use_irradiance=True,
+            cloud_entity=None,
+            cloud_threshold=None,
+            _use_cloud=False,
+            _irradiance_override=False,  # Override to False
+        )
+
+        assert climate.irradiance is False
+
+    def test_cloud_override(self, mock_hass: MagicMock, mock_logger) -> None:
+        """Test cloud uses override value when set."""
+        from custom_components.adaptive_cover.calculation import ClimateCoverData
+
+        climate = ClimateCoverData(
+            hass=mock_hass,
+            logger=mock_logger,
+            temp_entity=None,
+            temp_low=20.0,
+            temp_high=25.0,
+            presence_entity=None,
+            weather_entity=None,
+            weather_condition=[],
+            blind_type="cover_blind",
+            transparent_blind=False,
+            lux_entity=None,
+            irradiance_entity=None,
+            lux_threshold=None,
+            irradiance_threshold=None,
+            _use_lux=False,
+            _use_irradiance=False,
+            cloud_entity="sensor.cloud",
+            cloud_threshold=50,
+            _use_cloud=True,
+            _cloud_override=True,  # Override to True
+        )
+
+        assert climate.cloud is True
+
+
+class TestPresenceFromDifferentDomains:
+    """Tests for presence detection from different entity domains."""
+
+    def test_is_presence_from_zone_domain(
+        self, mock_hass: MagicMock, mock_logger
+    ) -> None:
+        """Test is_presence returns True when zone has persons."""
+        from custom_components.adaptive_cover.calculation import ClimateCoverData
+
+        # Mock zone state to return "2" (2 persons in zone)
+        with (
+            patch(
+                "custom_components.adaptive_cover.calculation.get_safe_state",
+                return_value="2",
+            ),
+            patch(
+                "custom_components.adaptive_cover.calculation.get_domain",
+                return_value="zone",
+            ),
+        ):
+            climate = ClimateCoverData(
+                hass=mock_hass,
+                logger=mock_logger,
+                temp_entity=None,
+                temp_low=20.0,
+                temp_high=25.0,
+                presence_entity="zone.home",
+                weather_entity=None,
+                weather_condition=[],
+                blind_type="cover_blind",
+                transparent_blind=False,
+                lux_entity=None,
+                irradiance_entity=None,
+                lux_threshold=None,
+                irradiance_threshold=None,
+                _use_lux=False,
+                _use_irradiance=False,
+                cloud_entity=None,
+                cloud_threshold=None,
+                _use_cloud=False,
+            )
+
+            assert climate.is_presence is True
+
+    def test_is_presence_from_zone_domain_empty(
+        self, mock_hass: MagicMock, mock_logger
+    ) -> None:
+        """Test is_presence returns False when zone has no persons."""
+        from custom_components.adaptive_cover.calculation import ClimateCoverData
+
+        # Mock zone state to return "0" (0 persons in zone)
+        with (
+            patch(
+                "custom_components.adaptive_cover.calculation.get_safe_state",
+                return_value="0",
+            ),
+            patch(
+                "custom_components.adaptive_cover.calculation.get_domain",
+                return_value="zone",
+            ),
+        ):
+            climate = ClimateCoverData(
+                hass=mock_hass,
+                logger=mock_logger,
+                temp_entity=None,
+                temp_low=20.0,
+                temp_high=25.0,
+                presence_entity="zone.home",
+                weather_entity=None,
+                weather_condition=[],
+                blind_type="cover_blind",
+                transparent_blind=False,
+                lux_entity=None,
+                irradiance_entity=None,
+                lux_threshold=None,
+                irradiance_threshold=None,
+                _use_lux=False,
+                _use_irradiance=False,
+                cloud_entity=None,
+                cloud_threshold=None,
+                _use_cloud=False,
+            )
+
+            assert climate.is_presence is False
+
+    def test_is_presence_unknown_domain_returns_true(
+        self, mock_hass: MagicMock, mock_logger
+    ) -> None:
+        """Test is_presence returns True for unknown entity domains."""
+        from custom_components.adaptive_cover.calculation import ClimateCoverData
+
+        # Mock an unknown domain
+        with (
+            patch(
+                "custom_components.adaptive_cover.calculation.get_safe_state",
+                return_value="some_state",
+            ),
+            patch(
+                "custom_components.adaptive_cover.calculation.get_domain",
+                return_value="unknown_domain",
+            ),
+        ):
+            climate = ClimateCoverData(
+                hass=mock_hass,
+                logger=mock_logger,
+                temp_entity=None,
+                temp_low=20.0,
+                temp_high=25.0,
+                presence_entity="unknown_domain.test",
+                weather_entity=None,
+                weather_condition=[],
+                blind_type="cover_blind",
+                transparent_blind=False,
+                lux_entity=None,
+                irradiance_entity=None,
+                lux_threshold=None,
+                irradiance_threshold=None,
+                _use_lux=False,
+                _use_irradiance=False,
+                cloud_entity=None,
+                cloud_threshold=None,
+                _use_cloud=False,
+            )
+
+            # Unknown domain defaults to True
+            assert climate.is_presence is True
+
+
+class TestInsideTemperatureFromClimate:
+    """Tests for inside temperature from climate entity."""
+
+    def test_inside_temp_from_climate_entity(
+        self, mock_hass: MagicMock, mock_logger
+    ) -> None:
+        """Test inside_temperature is fetched from climate entity."""
+        from custom_components.adaptive_cover.calculation import ClimateCoverData
+
+        # Mock state_attr to return temperature from climate entity
+        with (
+            patch(
+                "custom_components.adaptive_cover.calculation.get_domain",
+                return_value="climate",
+            ),
+            patch(
+                "custom_components.adaptive_cover.calculation.state_attr",
+                return_value=22.0,
+            ),
+        ):
+            climate = ClimateCoverData(
+                hass=mock_hass,
+                logger=mock_logger,
+                temp_entity="climate.living_room",  # Climate entity
+                temp_low=20.0,
+                temp_high=25.0,
+                presence_entity=None,
+                weather_entity=None,
+                weather_condition=[],
+                blind_type="cover_blind",
+                transparent_blind=False,
+                lux_entity=None,
+                irradiance_entity=None,
+                lux_threshold=None,
+                irradiance_threshold=None,
+                _use_lux=False,
+                _use_irradiance=False,
+                cloud_entity=None,
+                cloud_threshold=None,
+                _use_cloud=False,
+            )
+
+            assert climate.inside_temperature == 22.0
+
+
+class TestOverrideNoneValues:
+    """Tests for override tuples with None values."""
+
+    def test_is_presence_override_with_none_value(
+        self, mock_hass: MagicMock, mock_logger
+    ) -> None:
+        """Test is_presence override with None value uses entity."""
+        from custom_components.adaptive_cover.calculation import ClimateCoverData
+
+        # Override is set but value is None - should fall through to entity check
+        with (
+            patch(
+                "custom_components.adaptive_cover.calculation.get_safe_state",
+                return_value="on",
+            ),
+            patch(
+                "custom_components.adaptive_cover.calculation.get_domain",
+                return_value="binary_sensor",
+            ),
+        ):
+            climate = ClimateCoverData(
+                hass=mock_hass,
+                logger=mock_logger,
+                temp_entity=None,
+                temp_low=20.0,
+                temp_high=25.0,
+                presence_entity="binary_sensor.motion",
+                weather_entity=None,
+                weather_condition=[],
+                blind_type="cover_blind",
+                transparent_blind=False,
+                lux_entity=None,
+                irradiance_entity=None,
+                lux_threshold=None,
+                irradiance_threshold=None,
+                _use_lux=False,
+                _use_irradiance=False,
+                cloud_entity=None,
+                cloud_threshold=None,
+                _use_cloud=False,
+                _is_presence_override=(False, None),  # use_override=False, value=None
+            )
+
+            # Should use entity value since use_override is False
+            assert climate.is_presence is True
+
+    def test_has_direct_sun_override_with_none_value(
+        self, mock_hass: MagicMock, mock_logger
+    ) -> None:
+        """Test has_direct_sun override with None value uses entity."""
+        from custom_components.adaptive_cover.calculation import ClimateCoverData
+
+        mock_state = MagicMock()
+        mock_state.state = "sunny"
+        mock_hass.states.get.return_value = mock_state
+
+        with patch(
+            "custom_components.adaptive_cover.calculation.get_safe_state",
+            return_value="sunny",
+        ):
+            climate = ClimateCoverData(
+                hass=mock_hass,
+                logger=mock_logger,
+                temp_entity=None,
+                temp_low=20.0,
+                temp_high=25.0,
+                presence_entity=None,
+                weather_entity="weather.home",
+                weather_condition=["sunny"],
+                blind_type="cover_blind",
+                transparent_blind=False,
+                lux_entity=None,
+                irradiance_entity=None,
+                lux_threshold=None,
+                irradiance_threshold=None,
+                _use_lux=False,
+                _use_irradiance=False,
+                cloud_entity=None,
+                cloud_threshold=None,
+                _use_cloud=False,
+                _has_direct_sun_override=(False, None),  # use_override=False
+            )
+
+            # Should use entity value since use_override is False
+            assert climate.has_direct_sun is True
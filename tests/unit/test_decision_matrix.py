@@ -26,11 +26,11 @@ Decision Tree Summary:
 
 from __future__ import annotations
 
+import math
 from datetime import datetime
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, PropertyMock, patch
 
-import numpy as np
 import pytest
 
 from custom_components.adaptive_cover.calculation import (
@@ -47,7 +47,7 @@ if TYPE_CHECKING:
 
 
 def create_vertical_cover(
-    mock_hass: MagicMock,
+    shared_hass: MagicMock,
     mock_logger: ConfigContextAdapter,
     sol_azi: float = 180.0,
     sol_elev: float = 45.0,
@@ -63,7 +63,7 @@ def create_vertical_cover(
         mock_sun_data.return_value.sunrise.return_value = datetime(2099, 6, 21, 5, 0, 0)
 
         return AdaptiveVerticalCover(
-            hass=mock_hass,
+            hass=shared_hass,
             logger=mock_logger,
             sol_azi=sol_azi,
             sol_elev=sol_elev,
@@ -93,7 +93,7 @@ def create_vertical_cover(
 
 
 def create_tilt_cover(
-    mock_hass: MagicMock,
+    shared_hass: MagicMock,
     mock_logger: ConfigContextAdapter,
     sol_azi: float = 180.0,
     sol_elev: float = 45.0,
@@ -110,7 +110,7 @@ def create_tilt_cover(
         mock_sun_data.return_value.sunrise.return_value = datetime(2099, 6, 21, 5, 0, 0)
 
         return AdaptiveTiltCover(
-            hass=mock_hass,
+            hass=shared_hass,
             logger=mock_logger,
             sol_azi=sol_azi,
             sol_elev=sol_elev,
@@ -151,10 +151,10 @@ class TestForceMode:
     """
 
     def test_sun_valid_returns_calculated(
-        self, mock_hass: MagicMock, mock_logger: ConfigContextAdapter
+        self, shared_hass: MagicMock, mock_logger: ConfigContextAdapter
     ) -> None:
         """Test: direct_sun_valid=True returns calculated position."""
-        cover = create_vertical_cover(mock_hass, mock_logger, h_def=60)
+        cover = create_vertical_cover(shared_hass, mock_logger, h_def=60)
 
         with patch.object(
             type(cover), "direct_sun_valid", new_callable=PropertyMock
@@ -167,10 +167,10 @@ class TestForceMode:
                 assert result == 35
 
     def test_sun_invalid_returns_default(
-        self, mock_hass: MagicMock, mock_logger: ConfigContextAdapter
+        self, shared_hass: MagicMock, mock_logger: ConfigContextAdapter
     ) -> None:
         """Test: direct_sun_valid=False returns default position."""
-        cover = create_vertical_cover(mock_hass, mock_logger, h_def=60)
+        cover = create_vertical_cover(shared_hass, mock_logger, h_def=60)
 
         with (
             patch.object(
@@ -241,7 +241,7 @@ class TestAutoModeWithoutClimateMode:
     )
     def test_weather_cloud_combinations(
         self,
-        mock_hass: MagicMock,
+        shared_hass: MagicMock,
         mock_logger: ConfigContextAdapter,
         dsv: bool,
         has_direct_sun: bool | None,
@@ -249,7 +249,7 @@ class TestAutoModeWithoutClimateMode:
         expected_type: str,
     ) -> None:
         """Test all combinations of weather and cloud toggles."""
-        cover = create_vertical_cover(mock_hass, mock_logger, h_def=60)
+        cover = create_vertical_cover(shared_hass, mock_logger, h_def=60)
         calculated_value = 35
 
         with (
@@ -347,7 +347,7 @@ class TestHasActualSunLogic:
     )
     def test_has_actual_sun_combinations(
         self,
-        mock_hass: MagicMock,
+        shared_hass: MagicMock,
         mock_logger: ConfigContextAdapter,
         climate_data_factory,
         dsv: bool,
@@ -358,7 +358,7 @@ class TestHasActualSunLogic:
         expected: bool,
     ) -> None:
         """Test _has_actual_sun() with all sensor combinations."""
-        cover = create_vertical_cover(mock_hass, mock_logger, h_def=60)
+        cover = create_vertical_cover(shared_hass, mock_logger, h_def=60)
         climate_data = climate_data_factory(
             has_direct_sun=has_sun,
             lux=lux,
@@ -421,7 +421,7 @@ class TestClimateModeWithPresence:
     )
     def test_presence_behavior(
         self,
-        mock_hass: MagicMock,
+        shared_hass: MagicMock,
         mock_logger: ConfigContextAdapter,
         climate_data_factory,
         has_actual_sun: bool,
@@ -431,7 +431,7 @@ class TestClimateModeWithPresence:
         expected_type: str,
     ) -> None:
         """Test climate mode output with presence."""
-        cover = create_vertical_cover(mock_hass, mock_logger, h_def=60)
+        cover = create_vertical_cover(shared_hass, mock_logger, h_def=60)
         calculated_value = 35
 
         climate_data = climate_data_factory(
@@ -500,7 +500,7 @@ class TestClimateModeWithoutPresence:
     )
     def test_no_presence_temperature_behavior(
         self,
-        mock_hass: MagicMock,
+        shared_hass: MagicMock,
         mock_logger: ConfigContextAdapter,
         climate_data_factory,
         has_actual_sun: bool,
@@ -509,7 +509,7 @@ class TestClimateModeWithoutPresence:
         expected,
     ) -> None:
         """Test climate mode output without presence."""
-        cover = create_vertical_cover(mock_hass, mock_logger, h_def=60)
+        cover = create_vertical_cover(shared_hass, mock_logger, h_def=60)
         calculated_value = 35
 
         climate_data = climate_data_factory(
@@ -560,12 +560,12 @@ class TestTiltCoverSpecific:
 
     def test_tilt_mode1_winter_no_presence_returns_100(
         self,
-        mock_hass: MagicMock,
+        shared_hass: MagicMock,
         mock_logger: ConfigContextAdapter,
         climate_data_factory,
     ) -> None:
         """Test tilt mode1 in winter without presence returns 100."""
-        cover = create_tilt_cover(mock_hass, mock_logger, h_def=50, mode="mode1")
+        cover = create_tilt_cover(shared_hass, mock_logger, h_def=50, mode="mode1")
 
         climate_data = climate_data_factory(
             is_presence=False,
@@ -590,13 +590,13 @@ class TestTiltCoverSpecific:
 
     def test_tilt_mode2_winter_no_presence_returns_parallel(
         self,
-        mock_hass: MagicMock,
+        shared_hass: MagicMock,
         mock_logger: ConfigContextAdapter,
         climate_data_factory,
     ) -> None:
         """Test tilt mode2 in winter without presence returns parallel angle."""
         cover = create_tilt_cover(
-            mock_hass, mock_logger, h_def=50, mode="mode2", sol_elev=45.0
+            shared_hass, mock_logger, h_def=50, mode="mode2", sol_elev=45.0
         )
 
         climate_data = climate_data_factory(
@@ -619,7 +619,7 @@ class TestTiltCoverSpecific:
             result = state.tilt_state()
 
             # Calculate expected: (beta + 90) / 180 * 100
-            beta = np.rad2deg(cover.beta)
+            beta = math.degrees(cover.beta)
             expected = (beta + 90) / 180 * 100
 
             assert result == pytest.approx(expected, rel=0.01)
@@ -630,13 +630,13 @@ class TestTiltCoverSpecific:
     )
     def test_tilt_with_presence_ignores_winter(
         self,
-        mock_hass: MagicMock,
+        shared_hass: MagicMock,
         mock_logger: ConfigContextAdapter,
         climate_data_factory,
         mode: str,
     ) -> None:
         """Test tilt cover with presence ignores winter, uses calculated."""
-        cover = create_tilt_cover(mock_hass, mock_logger, h_def=50, mode=mode)
+        cover = create_tilt_cover(shared_hass, mock_logger, h_def=50, mode=mode)
         calculated_value = 45
 
         climate_data = climate_data_factory(
@@ -674,13 +674,13 @@ class TestTiltCoverSpecific:
     )
     def test_tilt_no_actual_sun_returns_default(
         self,
-        mock_hass: MagicMock,
+        shared_hass: MagicMock,
         mock_logger: ConfigContextAdapter,
         climate_data_factory,
         mode: str,
     ) -> None:
         """Test tilt cover without actual sun returns default."""
-        cover = create_tilt_cover(mock_hass, mock_logger, h_def=50, mode=mode)
+        cover = create_tilt_cover(shared_hass, mock_logger, h_def=50, mode=mode)
 
         climate_data = climate_data_factory(
             is_presence=False,
@@ -712,12 +712,12 @@ class TestTiltCoverSpecific:
 
     def test_tilt_mode2_summer_no_presence_returns_0(
         self,
-        mock_hass: MagicMock,
+        shared_hass: MagicMock,
         mock_logger: ConfigContextAdapter,
         climate_data_factory,
     ) -> None:
         """Test tilt mode2 in summer without presence returns 0 (closed)."""
-        cover = create_tilt_cover(mock_hass, mock_logger, h_def=50, mode="mode2")
+        cover = create_tilt_cover(shared_hass, mock_logger, h_def=50, mode="mode2")
 
         climate_data = climate_data_factory(
             is_presence=False,
@@ -755,11 +755,11 @@ class TestPositionLimits:
     """
 
     def test_max_position_always_applied(
-        self, mock_hass: MagicMock, mock_logger: ConfigContextAdapter
+        self, shared_hass: MagicMock, mock_logger: ConfigContextAdapter
     ) -> None:
         """Test max_position always applied when max_pos_bool=False."""
         cover = create_vertical_cover(
-            mock_hass, mock_logger, h_def=60, max_pos=70, max_pos_bool=False
+            shared_hass, mock_logger, h_def=60, max_pos=70, max_pos_bool=False
         )
 
         with (
@@ -776,11 +776,11 @@ class TestPositionLimits:
             assert result == 70
 
     def test_max_position_conditional_with_sun(
-        self, mock_hass: MagicMock, mock_logger: ConfigContextAdapter
+        self, shared_hass: MagicMock, mock_logger: ConfigContextAdapter
     ) -> None:
         """Test max_position conditionally applied when dsv=True."""
         cover = create_vertical_cover(
-            mock_hass, mock_logger, h_def=60, max_pos=70, max_pos_bool=True
+            shared_hass, mock_logger, h_def=60, max_pos=70, max_pos_bool=True
         )
 
         with (
@@ -797,11 +797,11 @@ class TestPositionLimits:
             assert result == 70
 
     def test_max_position_conditional_without_sun(
-        self, mock_hass: MagicMock, mock_logger: ConfigContextAdapter
+        self, shared_hass: MagicMock, mock_logger: ConfigContextAdapter
     ) -> None:
         """Test max_position NOT applied when conditional and dsv=False."""
         cover = create_vertical_cover(
-            mock_hass, mock_logger, h_def=80, max_pos=70, max_pos_bool=True
+            shared_hass, mock_logger, h_def=80, max_pos=70, max_pos_bool=True
         )
 
         with (
@@ -823,11 +823,11 @@ class TestPositionLimits:
             assert result == 80
 
     def test_min_position_always_applied(
-        self, mock_hass: MagicMock, mock_logger: ConfigContextAdapter
+        self, shared_hass: MagicMock, mock_logger: ConfigContextAdapter
     ) -> None:
         """Test min_position always applied when min_pos_bool=False."""
         cover = create_vertical_cover(
-            mock_hass, mock_logger, h_def=60, min_pos=30, min_pos_bool=False
+            shared_hass, mock_logger, h_def=60, min_pos=30, min_pos_bool=False
         )
 
         with (
@@ -844,11 +844,11 @@ class TestPositionLimits:
             assert result == 30
 
     def test_min_position_conditional_with_sun(
-        self, mock_hass: MagicMock, mock_logger: ConfigContextAdapter
+        self, shared_hass: MagicMock, mock_logger: ConfigContextAdapter
     ) -> None:
         """Test min_position conditionally applied when dsv=True."""
         cover = create_vertical_cover(
-            mock_hass, mock_logger, h_def=60, min_pos=30, min_pos_bool=True
+            shared_hass, mock_logger, h_def=60, min_pos=30, min_pos_bool=True
         )
 
         with (
@@ -865,11 +865,11 @@ class TestPositionLimits:
             assert result == 30
 
     def test_min_position_conditional_without_sun(
-        self, mock_hass: MagicMock, mock_logger: ConfigContextAdapter
+        self, shared_hass: MagicMock, mock_logger: ConfigContextAdapter
     ) -> None:
         """Test min_position NOT applied when conditional and dsv=False."""
         cover = create_vertical_cover(
-            mock_hass, mock_logger, h_def=20, min_pos=30, min_pos_bool=True
+            shared_hass, mock_logger, h_def=20, min_pos=30, min_pos_bool=True
         )
 
         with (
@@ -891,12 +891,12 @@ class TestPositionLimits:
             assert result == 20
 
     def test_max_takes_precedence_over_min(
-        self, mock_hass: MagicMock, mock_logger: ConfigContextAdapter
+        self, shared_hass: MagicMock, mock_logger: ConfigContextAdapter
     ) -> None:
         """Test that max position is applied after min (max wins if conflicting)."""
         # This tests the order of application in the code
         cover = create_vertical_cover(
-            mock_hass,
+            shared_hass,
             mock_logger,
             h_def=60,
             max_pos=70,
@@ -920,11 +920,11 @@ class TestPositionLimits:
             assert result == 70
 
     def test_no_limits_active(
-        self, mock_hass: MagicMock, mock_logger: ConfigContextAdapter
+        self, shared_hass: MagicMock, mock_logger: ConfigContextAdapter
     ) -> None:
         """Test result unchanged when no limits are active."""
         cover = create_vertical_cover(
-            mock_hass, mock_logger, h_def=60, max_pos=100, min_pos=0
+            shared_hass, mock_logger, h_def=60, max_pos=100, min_pos=0
         )
 
         with (
@@ -951,13 +951,13 @@ class TestClimatePositionLimits:
 
     def test_climate_max_position_applied(
         self,
-        mock_hass: MagicMock,
+        shared_hass: MagicMock,
         mock_logger: ConfigContextAdapter,
         climate_data_factory,
     ) -> None:
         """Test max position limit applied in climate mode."""
         cover = create_vertical_cover(
-            mock_hass, mock_logger, h_def=60, max_pos=50, max_pos_bool=False
+            shared_hass, mock_logger, h_def=60, max_pos=50, max_pos_bool=False
         )
         climate_data = climate_data_factory(
             is_presence=True,
@@ -982,13 +982,13 @@ class TestClimatePositionLimits:
 
     def test_climate_min_position_applied(
         self,
-        mock_hass: MagicMock,
+        shared_hass: MagicMock,
         mock_logger: ConfigContextAdapter,
         climate_data_factory,
     ) -> None:
         """Test min position limit applied in climate mode."""
         cover = create_vertical_cover(
-            mock_hass, mock_logger, h_def=60, min_pos=25, min_pos_bool=False
+            shared_hass, mock_logger, h_def=60, min_pos=25, min_pos_bool=False
         )
         climate_data = climate_data_factory(
             is_presence=True,
@@ -1013,7 +1013,7 @@ class TestClimatePositionLimits:
 
     def test_climate_summer_close_respects_min_position(
         self,
-        mock_hass: MagicMock,
+        shared_hass: MagicMock,
         mock_logger: ConfigContextAdapter,
         climate_data_factory,
     ) -> None:
@@ -1021,7 +1021,7 @@ class TestClimatePositionLimits:
         # Note: min_pos is applied AFTER the summer/winter logic
         # So if min_pos=25, summer returns 0, then min_pos raises it to 25
         cover = create_vertical_cover(
-            mock_hass, mock_logger, h_def=60, min_pos=25, min_pos_bool=False
+            shared_hass, mock_logger, h_def=60, min_pos=25, min_pos_bool=False
         )
         climate_data = climate_data_factory(
             is_presence=False,
@@ -1046,13 +1046,13 @@ class TestClimatePositionLimits:
 
     def test_climate_winter_open_respects_max_position(
         self,
-        mock_hass: MagicMock,
+        shared_hass: MagicMock,
         mock_logger: ConfigContextAdapter,
         climate_data_factory,
     ) -> None:
         """Test winter open (100) is capped by max_position if applied."""
         cover = create_vertical_cover(
-            mock_hass, mock_logger, h_def=60, max_pos=75, max_pos_bool=False
+            shared_hass, mock_logger, h_def=60, max_pos=75, max_pos_bool=False
         )
         climate_data = climate_data_factory(
             is_presence=False,
@@ -1085,10 +1085,10 @@ class TestEdgeCases:
     """Tests for edge cases and boundary conditions."""
 
     def test_calculated_value_clipped_to_100(
-        self, mock_hass: MagicMock, mock_logger: ConfigContextAdapter
+        self, shared_hass: MagicMock, mock_logger: ConfigContextAdapter
     ) -> None:
         """Test calculated value above 100 is clipped."""
-        cover = create_vertical_cover(mock_hass, mock_logger)
+        cover = create_vertical_cover(shared_hass, mock_logger)
 
         with (
             patch.object(
@@ -1104,10 +1104,10 @@ class TestEdgeCases:
             assert result == 100
 
     def test_calculated_value_clipped_to_0(
-        self, mock_hass: MagicMock, mock_logger: ConfigContextAdapter
+        self, shared_hass: MagicMock, mock_logger: ConfigContextAdapter
     ) -> None:
         """Test calculated value below 0 is clipped."""
-        cover = create_vertical_cover(mock_hass, mock_logger)
+        cover = create_vertical_cover(shared_hass, mock_logger)
 
         with (
             patch.object(
@@ -1123,7 +1123,7 @@ class TestEdgeCases:
             assert result == 0
 
     def test_sunset_valid_uses_sunset_position(
-        self, mock_hass: MagicMock, mock_logger: ConfigContextAdapter
+        self, shared_hass: MagicMock, mock_logger: ConfigContextAdapter
     ) -> None:
         """Test that sunset_valid=True returns sunset_pos instead of h_def."""
         with patch(
@@ -1133,7 +1133,7 @@ class TestEdgeCases:
             mock_sun_data.return_value.sunrise.return_value = datetime(2099, 6, 21, 5)
 
             cover = AdaptiveVerticalCover(
-                hass=mock_hass,
+                hass=shared_hass,
                 logger=mock_logger,
                 sol_azi=180.0,
                 sol_elev=45.0,
@@ -1180,12 +1180,12 @@ class TestEdgeCases:
 
     def test_get_state_dispatches_to_tilt_for_cover_tilt(
         self,
-        mock_hass: MagicMock,
+        shared_hass: MagicMock,
         mock_logger: ConfigContextAdapter,
         climate_data_factory,
     ) -> None:
         """Test ClimateCoverState.get_state() dispatches to tilt_state for tilt covers."""
-        cover = create_tilt_cover(mock_hass, mock_logger, h_def=50, mode="mode1")
+        cover = create_tilt_cover(shared_hass, mock_logger, h_def=50, mode="mode1")
         climate_data = climate_data_factory(
             is_presence=True,
             has_direct_sun=True,
@@ -1211,12 +1211,12 @@ class TestEdgeCases:
 
     def test_get_state_uses_normal_type_for_cover_blind(
         self,
-        mock_hass: MagicMock,
+        shared_hass: MagicMock,
         mock_logger: ConfigContextAdapter,
         climate_data_factory,
     ) -> None:
         """Test ClimateCoverState.get_state() uses normal_type_cover for blinds."""
-        cover = create_vertical_cover(mock_hass, mock_logger, h_def=60)
+        cover = create_vertical_cover(shared_hass, mock_logger, h_def=60)
         climate_data = climate_data_factory(
             is_presence=True,
             has_direct_sun=True,